@@ -28,24 +28,76 @@ This is a fully offline system - no external API calls are made.
 """
 
 import os
+import queue
 import sys
+import functools
+import atexit
 import json
 import logging
 import socket
+import sqlite3
+import tempfile
+import time
 import uuid
+import weakref
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from threading import Event, Lock, Thread
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Optional, Sequence, Set, Tuple, Union
 from dataclasses import dataclass, field
 from enum import Enum
 
-# Try to import YAML
+# Try to import YAML (LibYAML's C loader when it was built in)
 try:
     import yaml
     HAS_YAML = True
+    try:
+        from yaml import CSafeLoader as _YAML_LOADER
+    except ImportError:
+        from yaml import SafeLoader as _YAML_LOADER
 except ImportError:
     HAS_YAML = False
 
+# Try to import orjson (faster log serialization and config parsing)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Runtime components, imported once. Optional so agentd.py still runs
+# (list/status/logs) outside the agents package.
+try:
+    from agents.core.runtime.memory import AgentMemory
+    from agents.core.runtime.sandbox import AgentSandbox
+    from agents.core.runtime.executor import AgentExecutor
+    HAS_RUNTIME = True
+except ImportError:
+    HAS_RUNTIME = False
+
+
+def _require_runtime() -> None:
+    """Raise ImportError if the runtime components are unavailable."""
+    if not HAS_RUNTIME:
+        raise ImportError("agents.core.runtime is not importable")
+
+
+def _load_yaml_file(path: Union[str, Path]) -> Any:
+    """Parse a YAML file with the fastest available safe loader."""
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+
+def _load_json_file(path: Union[str, Path]) -> Any:
+    """Parse a JSON file, with orjson when available."""
+    if HAS_ORJSON:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path) as f:
+        return json.load(f)
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -114,7 +166,8 @@ class TaskStep:
     completed_at: Optional[str] = None
     result: Optional[Any] = None
     error: Optional[str] = None
-    capability_checks: List[str] = field(default_factory=list)
+    # May be shared by reference (e.g. AgentConfig._cap_tuple) - never mutate
+    capability_checks: Sequence[str] = field(default_factory=list)
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -209,12 +262,129 @@ KNOWN_CAPABILITIES = {
 # Memory size limit (Section 5)
 MEMORY_SIZE_LIMIT = 1024 * 1024  # 1MB
 
+# Termux PREFIX (writable with filesystem.write)
+TERMUX_PREFIX = "/data/data/com.termux/files/usr"
+
+# validate_all issue messages, only formatted on the failing branch
+_ISSUE_UNKNOWN_CAP = "Unknown capability: {c}"
+_ISSUE_MISSING_SKILL = "Missing skill: {s}"
+_ISSUE_MISSING_MANIFEST = "Missing manifest for skill: {s}"
+_ISSUE_MISSING_CAP = "Skill '{s}' requires '{c}' but agent lacks it"
+_ISSUE_MISSING_ENTRYPOINT = "Missing entrypoint: {e}"
+
+# Format version of the persisted validate_all skill cache
+VALIDATE_CACHE_VERSION = 1
+
+# Format version of the persisted parsed agent config cache
+AGENT_CACHE_VERSION = 1
+
+# Log lines per stdout write in the logs CLI command
+LOG_WRITE_BATCH = 256
+
+# Most queued log entries the background writer folds into one flush
+LOG_BATCH_MAX = 512
+
+# Most per-agent log fds kept open (least recently used are closed)
+LOG_FD_LIMIT = 64
+
+# Bytes read per backward step when locating a log tail
+LOG_TAIL_CHUNK = 8192
+
+# Agent model file extensions (and the YAML subset)
+_AGENT_EXTS = (".yml", ".yaml", ".json")
+_YAML_EXTS = (".yml", ".yaml")
+
+# Threads used to parse changed agent model files
+AGENT_LOAD_WORKERS = 8
+
+# TTLs (seconds) for memoized read-only views
+STATUS_CACHE_TTL = 1.0
+AGENT_LIST_CACHE_TTL = 5.0
+
+
+def _default_agents_root() -> Path:
+    """Agents root used when none is given: $AGENTS_ROOT, else under the Termux prefix."""
+    if "AGENTS_ROOT" in os.environ:
+        return Path(os.environ["AGENTS_ROOT"])
+    prefix = os.environ.get("PREFIX", TERMUX_PREFIX)
+    return Path(prefix) / "share" / "agents"
+
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS" local time) of the last log timestamp
+_ts_prefix_cache: Tuple[int, str] = (-1, "")
+
+
+def _iso_timestamp(t_ns: int) -> str:
+    """
+    Format an epoch time in ns exactly like datetime.now().isoformat().
+    
+    The seconds part is formatted once per second and reused; only the
+    microseconds are appended per call.
+    """
+    global _ts_prefix_cache
+    sec, ns = divmod(t_ns, 1_000_000_000)
+    cached_sec, prefix = _ts_prefix_cache
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(sec))
+        _ts_prefix_cache = (sec, prefix)
+    us = ns // 1000
+    return f"{prefix}.{us:06d}" if us else prefix
+
+
+@functools.lru_cache(maxsize=1024)
+def _missing_capabilities(
+    agent_caps: FrozenSet[str],
+    required: Tuple[str, ...]
+) -> Tuple[str, ...]:
+    """Return the required capabilities (in order) missing from agent_caps."""
+    if agent_caps.issuperset(required):
+        return ()
+    return tuple(cap for cap in required if cap not in agent_caps)
+
+
+def _flush_daemon_logs(ref: "weakref.ref") -> None:
+    """atexit hook: write out a still-alive daemon's queued log entries."""
+    daemon = ref()
+    if daemon is not None:
+        daemon.flush()
+
+
+def _find_tail_start(f, size: int, limit: int) -> int:
+    """
+    Return the offset of the first of the last ``limit`` non-blank lines.
+    
+    Reads backwards from ``size`` in LOG_TAIL_CHUNK blocks; the bytes of a
+    line split across blocks are carried into the next (earlier) read.
+    """
+    pos = size
+    carry = b""
+    count = 0
+    while pos > 0:
+        n = min(LOG_TAIL_CHUNK, pos)
+        pos -= n
+        f.seek(pos)
+        chunk = f.read(n) + carry
+        
+        end = len(chunk)
+        while True:
+            nl = chunk.rfind(b"\n", 0, end)
+            if nl == -1:
+                break
+            if chunk[nl + 1:end].strip():
+                count += 1
+                if count == limit:
+                    return pos + nl + 1
+            end = nl
+        carry = chunk[:end]
+    
+    return 0
+
 
 # =============================================================================
 # SECTION: Agent Configuration
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class AgentConfig:
     """Agent configuration loaded from YAML/JSON."""
     name: str
@@ -225,6 +395,24 @@ class AgentConfig:
     sandbox_path: Optional[str] = None
     max_memory_bytes: int = MEMORY_SIZE_LIMIT
     max_task_timeout: int = 3600  # 1 hour
+    # Immutable snapshot of capabilities, shared by every TaskStep of this agent
+    _cap_tuple: Tuple[str, ...] = field(default=(), init=False, repr=False, compare=False)
+    # Capabilities as a set, for O(1) membership checks
+    _cap_set: FrozenSet[str] = field(default=frozenset(), init=False, repr=False, compare=False)
+    # Skills as a set, for O(1) "is this skill allowed" checks
+    _skills_set: FrozenSet[str] = field(default=frozenset(), init=False, repr=False, compare=False)
+    # First three skills, and their "a, b, c..." rendering for listings
+    _skills_preview: Tuple[str, ...] = field(default=(), init=False, repr=False, compare=False)
+    _skills_preview_str: str = field(default="", init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        self._cap_tuple = tuple(self.capabilities)
+        self._cap_set = frozenset(self.capabilities)
+        self._skills_set = frozenset(self.skills)
+        self._skills_preview = tuple(self.skills[:3])
+        self._skills_preview_str = ", ".join(self._skills_preview) + (
+            "..." if len(self.skills) > 3 else ""
+        )
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "AgentConfig":
@@ -239,18 +427,77 @@ class AgentConfig:
             max_task_timeout=data.get("max_task_timeout", 3600)
         )
     
+    def to_dict(self) -> Dict[str, Any]:
+        """Inverse of from_dict (used by the parsed-config cache)."""
+        return {
+            "name": self.name,
+            "description": self.description,
+            "capabilities": self.capabilities,
+            "skills": self.skills,
+            "memory_backend": self.memory_backend,
+            "sandbox_path": self.sandbox_path,
+            "max_memory_bytes": self.max_memory_bytes,
+            "max_task_timeout": self.max_task_timeout
+        }
+    
     def has_capability(self, cap: str) -> bool:
         """Check if agent has a specific capability."""
-        return cap in self.capabilities
+        return cap in self._cap_set
     
     def has_network_access(self) -> bool:
         """Check if agent has any network access."""
-        return ("network.local" in self.capabilities or 
-                "network.external" in self.capabilities)
+        return ("network.local" in self._cap_set or 
+                "network.external" in self._cap_set)
     
     def is_network_blocked(self) -> bool:
         """Check if agent has network.none (explicit block)."""
-        return "network.none" in self.capabilities
+        return "network.none" in self._cap_set
+
+
+# =============================================================================
+# SECTION: Agent Lookup Helpers
+# =============================================================================
+
+def _require_agent(not_found: Callable[[str], Any]) -> Callable:
+    """
+    Decorator for public AgentDaemon methods taking an agent name.
+    
+    The wrapped method keeps its ``(agent_name, ...)`` call signature but
+    receives the resolved AgentConfig instead of the name. Unknown agents
+    short-circuit to ``not_found(agent_name)``.
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(self, agent_name: str, *args, **kwargs):
+            agent = self._agents.get(agent_name)
+            if agent is None:
+                return not_found(agent_name)
+            return func(self, agent, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _capability_not_found(agent_name: str) -> Dict[str, Any]:
+    return {
+        "allowed": False,
+        "error": AgentError(
+            error_type=AgentErrorType.UNKNOWN_ERROR,
+            message=f"Agent not found: {agent_name}",
+            agent=agent_name
+        ).to_dict()
+    }
+
+
+def _access_not_found(agent_name: str) -> Dict[str, Any]:
+    return {"allowed": False, "error": "Agent not found"}
+
+
+def _clean_not_found(agent_name: str) -> Dict[str, Any]:
+    return {"success": False, "error": "Agent not found"}
+
+
+def _none_not_found(agent_name: str) -> None:
+    return None
 
 
 # =============================================================================
@@ -275,16 +522,12 @@ class AgentDaemon:
     - Log all actions (Section 9)
     """
     
+    # Agents roots whose standard directories this process already created
+    _dirs_created: Set[str] = set()
+    
     def __init__(self, agents_root: Optional[Path] = None):
         # Set up paths - prefer environment variables set by wrapper script
-        if agents_root:
-            self.agents_root = Path(agents_root)
-        elif "AGENTS_ROOT" in os.environ:
-            self.agents_root = Path(os.environ["AGENTS_ROOT"])
-        else:
-            # Default Termux path
-            prefix = os.environ.get("PREFIX", "/data/data/com.termux/files/usr")
-            self.agents_root = Path(prefix) / "share" / "agents"
+        self.agents_root = Path(agents_root) if agents_root else _default_agents_root()
         
         # Standard directories
         self.models_dir = self.agents_root / "models"
@@ -292,28 +535,82 @@ class AgentDaemon:
         self.sandboxes_dir = self.agents_root / "sandboxes"
         self.memory_dir = self.agents_root / "memory"
         self.logs_dir = self.agents_root / "logs"
+        self._logs_dir_str = os.fspath(self.logs_dir)
         self.swarm_dir = self.agents_root / "swarm"
-        
-        # Ensure directories exist
-        for d in [self.models_dir, self.skills_dir, self.sandboxes_dir,
-                  self.memory_dir, self.logs_dir, self.swarm_dir]:
-            d.mkdir(parents=True, exist_ok=True)
-        
-        # Load capabilities
+        self.validate_cache_file = self.agents_root / ".agentd-cache" / "validate-manifest.json"
+        # Latest validate cache payload not yet written, and its writer thread
+        self._validate_cache_payload: Optional[str] = None
+        self._validate_cache_writer: Optional[Thread] = None
+        self._validate_cache_lock = Lock()
+        self.agent_cache_file = self.agents_root / ".agentd-cache" / "agents.json"
+        
+        # Ensure directories exist (once per root per process; the isdir
+        # check catches a root that was removed since)
+        root_key = os.fspath(self.agents_root)
+        if root_key not in AgentDaemon._dirs_created or not os.path.isdir(self._logs_dir_str):
+            for d in [self.models_dir, self.skills_dir, self.sandboxes_dir,
+                      self.memory_dir, self.logs_dir, self.swarm_dir]:
+                d.mkdir(parents=True, exist_ok=True)
+            AgentDaemon._dirs_created.add(root_key)
+        
+        # Per-agent action log (Section 9); AGENTD_ACTION_LOG=0 disables it
+        self.action_log_enabled = os.environ.get("AGENTD_ACTION_LOG", "1") != "0"
+        
+        # Optional indexed log store (AGENTD_LOG_BACKEND=sqlite). The JSONL
+        # files are always written and stay the human-readable record.
+        self.log_backend = os.environ.get("AGENTD_LOG_BACKEND", "jsonl")
+        self.log_db_file = self.logs_dir / "logs.db"
+        self._log_db: Optional[sqlite3.Connection] = None
+        self._log_db_lock = Lock()
+        
+        # Log file path cache (agent name -> str path) and open O_APPEND fds
+        self._log_files: Dict[str, str] = {}
+        self._log_fds: "OrderedDict[str, int]" = OrderedDict()
+        self._log_locks: Dict[str, Lock] = defaultdict(Lock)
+        
+        # Entries are handed to a background writer that coalesces them into
+        # one write per agent; AGENTD_LOG_ASYNC=0 writes inline instead
+        self.log_async = os.environ.get("AGENTD_LOG_ASYNC", "1") != "0"
+        self._log_queue: "queue.SimpleQueue[tuple]" = queue.SimpleQueue()
+        self._log_writer: Optional[Thread] = None
+        self._log_writer_lock = Lock()
+        
+        # Load capabilities (known-name set is derived lazily and cached)
+        self._all_caps_cache: Optional[FrozenSet[str]] = None
         self.capabilities = self._load_capabilities()
         
-        # Agent cache
+        # Agent cache (plus per-file (mtime, size) for incremental reloads)
         self._agents: Dict[str, AgentConfig] = {}
+        self._agents_by_file: Dict[str, AgentConfig] = {}
+        self._agent_stat_keys: Dict[str, Tuple[int, int]] = {}
+        self._sandbox_paths: Dict[str, str] = {}
+        
+        # Memoized views: (expires_at monotonic time, value), reset on reload
+        self._status_cache: Tuple[float, Dict[str, Any]] = (0.0, {})
+        self._agents_list_cache: Tuple[float, List[Dict[str, Any]]] = (0.0, [])
+        
         self._load_agents()
         
-        # Skill manifest cache (for validation)
-        self._skill_manifests: Dict[str, Dict[str, Any]] = {}
+        # Skill manifest cache (for validation):
+        # name -> ((file, mtime, size), manifest, required capabilities)
+        self._skill_manifests: Dict[
+            str, Tuple[Tuple[str, int, int], Dict[str, Any], FrozenSet[str]]
+        ] = {}
+        
+        # Shared skill loader, created on first use (see _get_skill_loader)
+        self._loader = None
+        self._skills_dir_mtime = 0
+        
+        # Idle skill instances: (agent, skill) -> (manifest key, skill).
+        # An instance is checked out while a task uses it, so concurrent
+        # tasks never share one.
+        self._skill_instances: Dict[Tuple[str, str], Tuple[Any, Any]] = {}
         
         # Initialize swarm coordinator for emergent multi-agent behavior
         self._init_swarm()
         
-        logger.info(f"AgentDaemon initialized at {self.agents_root}")
-        logger.info(f"Loaded {len(self._agents)} agents")
+        logger.info("AgentDaemon initialized at %s", self.agents_root)
+        logger.info("Loaded %d agents", len(self._agents))
     
     # =========================================================================
     # SECTION: Initialization & Loading
@@ -322,16 +619,17 @@ class AgentDaemon:
     def _init_swarm(self) -> None:
         """Initialize swarm intelligence coordinator."""
         try:
-            from agents.core.swarm import SwarmCoordinator
-            self.swarm = SwarmCoordinator(self.swarm_dir)
+            from agents.core.swarm import SignalType, get_coordinator
+            self._signal_type = SignalType
+            self.swarm = get_coordinator(self.swarm_dir)
             # Run decay on startup to clean old signals
             self.swarm.maybe_decay()
             logger.info("Swarm intelligence initialized")
         except ImportError as e:
-            logger.warning(f"Swarm module not available: {e}")
+            logger.warning("Swarm module not available: %s", e)
             self.swarm = None
         except Exception as e:
-            logger.warning(f"Swarm initialization failed: {e}")
+            logger.warning("Swarm initialization failed: %s", e)
             self.swarm = None
     
     def get_swarm_emitter(self, agent_name: str):
@@ -367,8 +665,7 @@ class AgentDaemon:
         cap_file = self.agents_root / "core" / "models" / "capabilities.yml"
         
         if cap_file.exists() and HAS_YAML:
-            with open(cap_file) as f:
-                return yaml.safe_load(f)
+            return _load_yaml_file(cap_file)
         
         # Default minimal capabilities
         return {
@@ -376,53 +673,345 @@ class AgentDaemon:
             "capabilities": {}
         }
     
-    def _load_agent_file(self, filepath: Path) -> Optional[AgentConfig]:
+    def _load_agent_file(self, filepath: Union[str, Path]) -> Optional[AgentConfig]:
         """Load a single agent configuration."""
+        filepath = os.fspath(filepath)
         try:
-            if filepath.suffix in [".yml", ".yaml"] and HAS_YAML:
-                with open(filepath) as f:
-                    data = yaml.safe_load(f)
-            elif filepath.suffix == ".json":
-                with open(filepath) as f:
-                    data = json.load(f)
+            if filepath.endswith(_YAML_EXTS) and HAS_YAML:
+                data = _load_yaml_file(filepath)
+            elif filepath.endswith(".json"):
+                data = _load_json_file(filepath)
             else:
                 return None
             
             if data:
                 return AgentConfig.from_dict(data)
         except Exception as e:
-            logger.error(f"Failed to load {filepath}: {e}")
+            logger.error("Failed to load %s: %s", filepath, e)
         
         return None
     
     def _load_agents(self) -> None:
-        """Load all agent definitions."""
-        self._agents = {}
+        """
+        Load all agent definitions.
         
-        if not self.models_dir.exists():
-            return
+        Safe to call again for a reload: files whose mtime and size are
+        unchanged reuse their cached AgentConfig, changed or new files are
+        reparsed and removed files are dropped. Parsed configs are also
+        persisted to agent_cache_file, so a fresh daemon only parses the
+        files that changed since the last one ran.
+        """
+        self._resolved_sandboxes_root = str(self.sandboxes_dir.resolve()) + os.sep
+        
+        agents: Dict[str, AgentConfig] = {}
+        agents_by_file: Dict[str, AgentConfig] = {}
+        agent_stat_keys: Dict[str, Tuple[int, int]] = {}
+        
+        # Persisted configs, read on the first in-memory miss
+        disk_cache: Optional[Dict[str, Any]] = None
         
-        for filepath in self.models_dir.iterdir():
-            if filepath.suffix in [".yml", ".yaml", ".json"]:
-                agent = self._load_agent_file(filepath)
+        # (path, stat key, config) in directory order; config is None for
+        # files that still have to be parsed
+        found: List[Tuple[str, Tuple[int, int], Optional[AgentConfig]]] = []
+        to_parse: List[str] = []
+        
+        try:
+            entries = os.scandir(self.models_dir)
+        except OSError:
+            entries = None
+        
+        if entries is not None:
+            with entries:
+                for entry in entries:
+                    name = entry.name
+                    # A bare ".yml" has no stem (and no suffix, for Path)
+                    if not name.endswith(_AGENT_EXTS) or name in _AGENT_EXTS:
+                        continue
+                    
+                    key = entry.path
+                    try:
+                        if not entry.is_file():
+                            continue
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    stat_key = (st.st_mtime_ns, st.st_size)
+                    
+                    agent = self._agents_by_file.get(key)
+                    if agent is None or self._agent_stat_keys.get(key) != stat_key:
+                        if disk_cache is None:
+                            disk_cache = self._load_agent_cache()
+                        agent = self._agent_from_cache(disk_cache.get(key), stat_key)
+                        if agent is None:
+                            to_parse.append(key)
+                    
+                    found.append((key, stat_key, agent))
+        
+        # Parse changed files concurrently so file reads overlap
+        parsed: Dict[str, Optional[AgentConfig]] = {}
+        if len(to_parse) > 1:
+            with ThreadPoolExecutor(max_workers=min(AGENT_LOAD_WORKERS, len(to_parse))) as pool:
+                parsed = dict(zip(to_parse, pool.map(self._load_agent_file, to_parse)))
+        elif to_parse:
+            parsed = {to_parse[0]: self._load_agent_file(to_parse[0])}
+        
+        for key, stat_key, agent in found:
+            if agent is None:
+                agent = parsed.get(key)
                 if agent:
-                    self._agents[agent.name] = agent
-                    logger.debug(f"Loaded agent: {agent.name}")
+                    logger.debug("Loaded agent: %s", agent.name)
+            
+            if agent:
+                agents[agent.name] = agent
+                agents_by_file[key] = agent
+                agent_stat_keys[key] = stat_key
+        
+        # Removed files are pruned from the disk cache on its next write
+        if disk_cache is not None and (to_parse or disk_cache.keys() != agents_by_file.keys()):
+            self._save_agent_cache(agents_by_file, agent_stat_keys)
+        
+        # Swap in one go so readers never see a half-built registry
+        self._agents = agents
+        self._agents_by_file = agents_by_file
+        self._agent_stat_keys = agent_stat_keys
+        self._sandbox_paths = {
+            name: str(self.sandboxes_dir / name) for name in agents
+        }
+        self._status_cache = (0.0, {})
+        self._agents_list_cache = (0.0, [])
+    
+    @staticmethod
+    def _agent_from_cache(
+        cached: Any,
+        stat_key: Tuple[int, int]
+    ) -> Optional[AgentConfig]:
+        """Rebuild a persisted AgentConfig if it matches the file's stat key."""
+        if not isinstance(cached, list) or len(cached) != 3 or tuple(cached[:2]) != stat_key:
+            return None
+        try:
+            return AgentConfig.from_dict(cached[2])
+        except (AttributeError, TypeError):
+            return None
+    
+    def _load_agent_cache(self) -> Dict[str, Any]:
+        """Load persisted configs: {path: [mtime_ns, size, config dict]}."""
+        try:
+            with open(self.agent_cache_file) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        
+        if not isinstance(data, dict) or data.get("version") != AGENT_CACHE_VERSION:
+            return {}
+        agents = data.get("agents")
+        return agents if isinstance(agents, dict) else {}
+    
+    def _save_agent_cache(
+        self,
+        agents_by_file: Dict[str, AgentConfig],
+        stat_keys: Dict[str, Tuple[int, int]]
+    ) -> None:
+        """Persist parsed configs (write to a temp file, then rename)."""
+        cache_file = self.agent_cache_file
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        try:
+            payload = json.dumps({
+                "version": AGENT_CACHE_VERSION,
+                "agents": {
+                    key: [*stat_keys[key], agent.to_dict()]
+                    for key, agent in agents_by_file.items()
+                }
+            })
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, "w") as f:
+                f.write(payload)
+            os.replace(tmp_file, cache_file)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug("Failed to write agent cache: %s", e)
+    
+    def reload_agents(self) -> None:
+        """
+        Reload agent definitions, reparsing only changed files.
+        
+        Also drops cached skill classes and instances, so skill code
+        edited in place is picked up.
+        """
+        self._load_agents()
+        self.invalidate_skill_cache()
+        _missing_capabilities.cache_clear()
+        logger.info("Reloaded %d agents", len(self._agents))
     
     # =========================================================================
     # SECTION: Logging (Section 9 of System Prompt)
     # =========================================================================
     
-    def _get_log_file(self, agent_name: str) -> Path:
-        """Get log file path for agent."""
-        return self.logs_dir / f"{agent_name}.log"
+    def _get_log_file(self, agent_name: str) -> str:
+        """Get log file path for agent (a str, ready for open/os.open)."""
+        try:
+            return self._log_files[agent_name]
+        except KeyError:
+            log_file = os.path.join(self._logs_dir_str, f"{agent_name}.log")
+            self._log_files[agent_name] = log_file
+            return log_file
+    
+    def _get_log_fd(self, agent_name: str) -> int:
+        """
+        Get the agent's cached append-only log fd (caller holds its lock).
+        
+        The fd is reopened if the log file was removed or rotated away.
+        At most LOG_FD_LIMIT fds stay open; see _evict_log_fds.
+        """
+        fd = self._log_fds.get(agent_name)
+        if fd is not None:
+            if os.fstat(fd).st_nlink:
+                self._log_fds.move_to_end(agent_name)
+                return fd
+            os.close(fd)
+        
+        fd = os.open(
+            self._get_log_file(agent_name),
+            os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+            0o644
+        )
+        self._log_fds[agent_name] = fd
+        if len(self._log_fds) > LOG_FD_LIMIT:
+            self._evict_log_fds(agent_name)
+        return fd
+    
+    def _evict_log_fds(self, keep: str) -> None:
+        """
+        Close least recently used log fds until back under LOG_FD_LIMIT.
+        
+        An fd is only closed under its agent's lock; agents whose lock is
+        busy (mid-write) are skipped rather than waited on.
+        """
+        for victim in list(self._log_fds):
+            if len(self._log_fds) <= LOG_FD_LIMIT:
+                break
+            if victim == keep:
+                continue
+            lock = self._log_locks[victim]
+            if lock.acquire(blocking=False):
+                try:
+                    fd = self._log_fds.pop(victim, None)
+                    if fd is not None:
+                        os.close(fd)
+                finally:
+                    lock.release()
+    
+    def _start_log_writer(self) -> None:
+        """Start the background log writer thread (once)."""
+        with self._log_writer_lock:
+            if self._log_writer is None:
+                self._log_writer = Thread(
+                    target=self._log_writer_loop, name="agentd-log-writer", daemon=True
+                )
+                self._log_writer.start()
+                atexit.register(_flush_daemon_logs, weakref.ref(self))
+    
+    def _log_writer_loop(self) -> None:
+        """Drain queued entries and write them out in batches."""
+        q = self._log_queue
+        while True:
+            batch = [q.get()]
+            while len(batch) < LOG_BATCH_MAX:
+                try:
+                    batch.append(q.get_nowait())
+                except queue.Empty:
+                    break
+            
+            try:
+                self._write_log_batch(batch)
+            except Exception as e:
+                logger.error("Failed to write action log batch: %s", e)
+            finally:
+                for agent_name, flushed, _ in batch:
+                    if agent_name is None:
+                        flushed.set()
+    
+    def _write_log_batch(self, batch: List[tuple]) -> None:
+        """
+        Write (agent, payload, db row) entries, one write per agent.
+        
+        Flush markers (agent None) in the batch are ignored here.
+        """
+        frames: Dict[str, List[bytes]] = defaultdict(list)
+        rows = []
+        for agent_name, payload, row in batch:
+            if agent_name is None:
+                continue
+            frames[agent_name].append(payload)
+            if row is not None:
+                rows.append(row)
+        
+        for agent_name, payloads in frames.items():
+            data = b"".join(payloads)
+            with self._log_locks[agent_name]:
+                fd = self._get_log_fd(agent_name)
+                while data:
+                    data = data[os.write(fd, data):]
+        
+        if rows:
+            db = self._get_log_db()
+            with self._log_db_lock:
+                db.executemany(
+                    "INSERT INTO log(agent, ts, action, status, entry) VALUES (?, ?, ?, ?, ?)",
+                    rows
+                )
+                db.commit()
+    
+    def flush(self) -> None:
+        """Block until every action log entry queued so far is written."""
+        if self._log_writer is None:
+            return
+        flushed = Event()
+        self._log_queue.put((None, flushed, None))
+        flushed.wait()
+    
+    def close(self) -> None:
+        """Close cached log file descriptors and the sqlite log store."""
+        self.flush()
+        if self.swarm:
+            self.swarm.flush()
+        
+        for agent_name in list(self._log_fds):
+            with self._log_locks[agent_name]:
+                fd = self._log_fds.pop(agent_name, None)
+                if fd is not None:
+                    os.close(fd)
+        
+        with self._log_db_lock:
+            if self._log_db is not None:
+                self._log_db.close()
+                self._log_db = None
+    
+    def _get_log_db(self) -> Optional[sqlite3.Connection]:
+        """Open the sqlite log store on first use (None unless enabled)."""
+        if self.log_backend != "sqlite":
+            return None
+        
+        if self._log_db is None:
+            with self._log_db_lock:
+                if self._log_db is None:
+                    db = sqlite3.connect(str(self.log_db_file), check_same_thread=False)
+                    db.execute("PRAGMA journal_mode=WAL")
+                    db.execute(
+                        "CREATE TABLE IF NOT EXISTS log("
+                        "agent TEXT, ts REAL, action TEXT, status TEXT, entry TEXT)"
+                    )
+                    db.execute(
+                        "CREATE INDEX IF NOT EXISTS idx_agent_ts ON log(agent, ts DESC)"
+                    )
+                    db.commit()
+                    self._log_db = db
+        return self._log_db
     
     def _log_action(
         self,
         agent_name: str,
         action: str,
         status: str,
-        details: Optional[Dict[str, Any]] = None,
+        details: Optional[Any] = None,
         capability_checks: Optional[List[str]] = None,
         skill_loads: Optional[List[str]] = None,
         subprocess_cmd: Optional[str] = None,
@@ -440,11 +1029,19 @@ class AgentDaemon:
         - Subprocess commands
         - Errors
         - Final result
+        
+        ``details`` may be a dict or a zero-argument callable returning
+        one; the callable is only invoked when the entry is written.
         """
-        log_file = self._get_log_file(agent_name)
+        if not self.action_log_enabled:
+            return
+        
+        if callable(details):
+            details = details()
         
+        now_ns = time.time_ns()
         entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _iso_timestamp(now_ns),
             "agent": agent_name,
             "action": action,
             "status": status,
@@ -461,8 +1058,22 @@ class AgentDaemon:
         if error:
             entry["error"] = error.to_dict()
         
-        with open(log_file, "a") as f:
-            f.write(json.dumps(entry) + "\n")
+        # Serialize in the caller so the writer only does I/O
+        if HAS_ORJSON:
+            payload = orjson.dumps(entry, option=orjson.OPT_NON_STR_KEYS) + b"\n"
+        else:
+            payload = (json.dumps(entry) + "\n").encode()
+        
+        row = None
+        if self.log_backend == "sqlite":
+            row = (agent_name, now_ns / 1e9, action, status, payload[:-1].decode())
+        
+        if self.log_async:
+            if self._log_writer is None:
+                self._start_log_writer()
+            self._log_queue.put((agent_name, payload, row))
+        else:
+            self._write_log_batch([(agent_name, payload, row)])
     
     def _emit_swarm_signal(
         self,
@@ -483,7 +1094,7 @@ class AgentDaemon:
             return
         
         try:
-            from agents.core.swarm import SignalType
+            SignalType = self._signal_type
             
             if success:
                 self.swarm.emit(
@@ -511,7 +1122,7 @@ class AgentDaemon:
             
         except Exception as e:
             # Swarm errors should not affect task execution
-            logger.debug(f"Swarm signal emission failed: {e}")
+            logger.debug("Swarm signal emission failed: %s", e)
     
     # =========================================================================
     # SECTION: Capability Enforcement (Section 2 of System Prompt)
@@ -528,7 +1139,7 @@ class AgentDaemon:
         Before performing ANY action, you must check (Section 2):
         1. Does the agent have the required capability?
         """
-        if required not in agent.capabilities:
+        if required not in agent._cap_set:
             error = AgentError(
                 error_type=AgentErrorType.CAPABILITY_DENIED,
                 message=f"Agent '{agent.name}' lacks required capability: {required}",
@@ -571,7 +1182,7 @@ class AgentDaemon:
     def _check_sandbox_boundary(
         self,
         agent: AgentConfig,
-        path: Path
+        path: Union[str, Path]
     ) -> Tuple[bool, Optional[AgentError]]:
         """
         Check if path is within agent's sandbox.
@@ -579,19 +1190,23 @@ class AgentDaemon:
         Section 2: Does the action violate sandbox boundaries?
         Section 4: No agent may access another agent's sandbox
         """
-        sandbox_root = self.sandboxes_dir / agent.name
-        
         try:
-            resolved = Path(path).resolve()
-            sandbox_resolved = sandbox_root.resolve()
+            resolved_str = os.path.realpath(path)
+            
+            # All sandboxes live directly under sandboxes_dir, so the first
+            # path component below it names the sandbox owner
+            owner = None
+            if resolved_str.startswith(self._resolved_sandboxes_root):
+                rest = resolved_str[len(self._resolved_sandboxes_root):]
+                owner = rest.split(os.sep, 1)[0] or None
             
             # Allow access within sandbox
-            if str(resolved).startswith(str(sandbox_resolved)):
+            if owner == agent.name:
                 return True, None
             
             # Allow access to PREFIX (with filesystem.write capability)
-            termux_prefix = Path("/data/data/com.termux/files/usr")
-            if resolved.is_relative_to(termux_prefix):
+            if (resolved_str.startswith(TERMUX_PREFIX + os.sep)
+                    or resolved_str == TERMUX_PREFIX):
                 if agent.has_capability("filesystem.write"):
                     return True, None
                 else:
@@ -605,18 +1220,19 @@ class AgentDaemon:
                     return False, error
             
             # Check if trying to access another agent's sandbox
-            for other_agent in self._agents.values():
-                if other_agent.name != agent.name:
-                    other_sandbox = (self.sandboxes_dir / other_agent.name).resolve()
-                    if str(resolved).startswith(str(other_sandbox)):
-                        error = AgentError(
-                            error_type=AgentErrorType.SANDBOX_VIOLATION,
-                            message=f"Agent '{agent.name}' cannot access sandbox of '{other_agent.name}'",
-                            agent=agent.name,
-                            details={"target_sandbox": other_agent.name, "path": str(path)}
-                        )
-                        self._log_action(agent.name, "sandbox_check", "denied", error=error)
-                        return False, error
+            if owner is not None:
+                if owner in self._agents:
+                    message = f"Agent '{agent.name}' cannot access sandbox of '{owner}'"
+                else:
+                    message = f"Agent '{agent.name}' cannot access foreign sandbox '{owner}'"
+                error = AgentError(
+                    error_type=AgentErrorType.SANDBOX_VIOLATION,
+                    message=message,
+                    agent=agent.name,
+                    details={"target_sandbox": owner, "path": str(path)}
+                )
+                self._log_action(agent.name, "sandbox_check", "denied", error=error)
+                return False, error
             
             # Allow read access to general filesystem with capability
             if agent.has_capability("filesystem.read"):
@@ -626,7 +1242,7 @@ class AgentDaemon:
                 error_type=AgentErrorType.SANDBOX_VIOLATION,
                 message=f"Path '{path}' is outside agent sandbox",
                 agent=agent.name,
-                details={"sandbox": str(sandbox_root), "path": str(path)}
+                details={"sandbox": self._get_sandbox_path(agent.name), "path": str(path)}
             )
             self._log_action(agent.name, "sandbox_check", "denied", error=error)
             return False, error
@@ -640,6 +1256,13 @@ class AgentDaemon:
             )
             return False, error
     
+    def _get_sandbox_path(self, agent_name: str) -> str:
+        """Get an agent's (unresolved) sandbox path as a string."""
+        try:
+            return self._sandbox_paths[agent_name]
+        except KeyError:
+            return str(self.sandboxes_dir / agent_name)
+    
     def _check_network_access(
         self,
         agent: AgentConfig,
@@ -714,14 +1337,8 @@ class AgentDaemon:
         if not agent:
             return False, [f"Agent not found: {agent_name}"]
         
-        agent_caps = set(agent.capabilities)
-        missing = []
-        
-        for cap in required:
-            if cap not in agent_caps:
-                missing.append(cap)
-        
-        return len(missing) == 0, missing
+        missing = _missing_capabilities(agent._cap_set, tuple(required))
+        return not missing, list(missing)
     
     # =========================================================================
     # SECTION: Skill Loading (Section 3 of System Prompt)
@@ -729,29 +1346,53 @@ class AgentDaemon:
     
     def _get_skill_manifest(self, skill_name: str) -> Optional[Dict[str, Any]]:
         """Load skill manifest with caching."""
-        if skill_name in self._skill_manifests:
-            return self._skill_manifests[skill_name]
+        entry = self._get_skill_manifest_entry(skill_name)
+        return entry[0] if entry else None
+    
+    def _get_skill_manifest_entry(
+        self,
+        skill_name: str
+    ) -> Optional[Tuple[Dict[str, Any], FrozenSet[str]]]:
+        """
+        Load skill manifest and its required capabilities with caching.
         
+        Cached entries are keyed on the manifest file name, mtime and size,
+        so an edited manifest is reparsed on the next lookup.
+        
+        Returns:
+            (manifest, frozenset of requires_capabilities) or None
+        """
         skill_dir = self.skills_dir / skill_name
+        cached = self._skill_manifests.get(skill_name)
         
         # Try YAML first
         for manifest_file in ["skill.yml", "skill.yaml", "skill.json"]:
             manifest_path = skill_dir / manifest_file
-            if manifest_path.exists():
-                try:
-                    if manifest_file.endswith(".json"):
-                        with open(manifest_path) as f:
-                            manifest = json.load(f)
-                    elif HAS_YAML:
-                        with open(manifest_path) as f:
-                            manifest = yaml.safe_load(f)
-                    else:
-                        continue
-                    
-                    self._skill_manifests[skill_name] = manifest
-                    return manifest
-                except Exception as e:
-                    logger.error(f"Failed to load skill manifest {manifest_path}: {e}")
+            try:
+                st = os.lstat(manifest_path)
+            except OSError:
+                continue
+            
+            key = (manifest_file, st.st_mtime_ns, st.st_size)
+            if cached and cached[0] == key:
+                return cached[1], cached[2]
+            
+            try:
+                if manifest_file.endswith(".json"):
+                    manifest = _load_json_file(manifest_path)
+                elif HAS_YAML:
+                    manifest = _load_yaml_file(manifest_path)
+                else:
+                    continue
+                
+                required = frozenset(
+                    manifest.get("requires_capabilities") or []
+                    if isinstance(manifest, dict) else []
+                )
+                self._skill_manifests[skill_name] = (key, manifest, required)
+                return manifest, required
+            except Exception as e:
+                logger.error("Failed to load skill manifest %s: %s", manifest_path, e)
         
         return None
     
@@ -769,7 +1410,7 @@ class AgentDaemon:
         - Reject skills that exceed agent permissions
         """
         # Check skill is declared
-        if skill_name not in agent.skills:
+        if skill_name not in agent._skills_set:
             error = AgentError(
                 error_type=AgentErrorType.SKILL_NOT_ALLOWED,
                 message=f"Agent '{agent.name}' does not have skill '{skill_name}' in its allowed list",
@@ -804,6 +1445,28 @@ class AgentDaemon:
         )
         return True, None
     
+    def _get_skill_loader(self):
+        """
+        Get the daemon's shared SkillLoader.
+        
+        The loader's caches are dropped when the skills directory mtime
+        changes (a skill was added, removed or renamed).
+        """
+        if self._loader is None:
+            from agents.skills.loader import SkillLoader
+            self._loader = SkillLoader(self.skills_dir)
+        
+        try:
+            mtime = self.skills_dir.stat().st_mtime_ns
+        except OSError:
+            mtime = 0
+        
+        if mtime != self._skills_dir_mtime:
+            self._loader.invalidate()
+            self._skills_dir_mtime = mtime
+        
+        return self._loader
+    
     def _load_skill_for_agent(
         self,
         agent: AgentConfig,
@@ -812,16 +1475,28 @@ class AgentDaemon:
         sandbox,
         memory
     ):
-        """Load and instantiate a skill for an agent."""
+        """
+        Load and instantiate a skill for an agent.
+        
+        Reuses the agent's idle instance of the skill when its manifest is
+        unchanged, rebinding it to this task's executor, sandbox and memory.
+        Hand the skill back with _release_skill once the task is done.
+        """
         # Validate first
         valid, error = self._validate_skill_for_agent(agent, skill_name)
         if not valid:
             raise AgentException(error)
         
+        cached = self._skill_instances.pop((agent.name, skill_name), None)
+        if cached and cached[0] == self._skill_manifest_key(skill_name):
+            skill = cached[1]
+            skill.executor = executor
+            skill.sandbox = sandbox
+            skill.memory = memory
+            return skill
+        
         # Import and create
-        from agents.skills.loader import SkillLoader
-        loader = SkillLoader(self.skills_dir)
-        skill = loader.create_skill(skill_name, executor, sandbox, memory)
+        skill = self._get_skill_loader().create_skill(skill_name, executor, sandbox, memory)
         
         if skill is None:
             error = AgentError(
@@ -834,6 +1509,36 @@ class AgentDaemon:
         
         return skill
     
+    def _skill_manifest_key(self, skill_name: str) -> Optional[Tuple[str, int, int]]:
+        """Return the (file, mtime, size) key of the cached skill manifest."""
+        cached = self._skill_manifests.get(skill_name)
+        return cached[0] if cached else None
+    
+    def _release_skill(self, agent: AgentConfig, skill_name: str, skill) -> None:
+        """Return a skill instance to the agent's idle cache."""
+        key = self._skill_manifest_key(skill_name)
+        if key is not None:
+            self._skill_instances[(agent.name, skill_name)] = (key, skill)
+    
+    def invalidate_skill_cache(self, skill_name: Optional[str] = None) -> None:
+        """
+        Drop cached instances, class and manifest of a skill (all if None).
+        
+        Call after replacing a skill's code in place; manifest edits are
+        picked up automatically.
+        """
+        if self._loader is not None:
+            self._loader.invalidate(skill_name)
+        
+        if skill_name is None:
+            self._skill_instances.clear()
+            self._skill_manifests.clear()
+            return
+        
+        for key in [k for k in self._skill_instances if k[1] == skill_name]:
+            self._skill_instances.pop(key, None)
+        self._skill_manifests.pop(skill_name, None)
+    
     # =========================================================================
     # SECTION: Memory Management (Section 5 of System Prompt)
     # =========================================================================
@@ -868,8 +1573,18 @@ class AgentDaemon:
     # =========================================================================
     
     def list_agents(self) -> List[Dict[str, Any]]:
-        """List all available agents."""
-        return [
+        """
+        List all available agents.
+        
+        Memoized for AGENT_LIST_CACHE_TTL seconds; callers must not mutate
+        the returned list.
+        """
+        now = time.monotonic()
+        expires_at, agents = self._agents_list_cache
+        if now < expires_at:
+            return agents
+        
+        agents = [
             {
                 "name": agent.name,
                 "description": agent.description,
@@ -878,6 +1593,8 @@ class AgentDaemon:
             }
             for agent in self._agents.values()
         ]
+        self._agents_list_cache = (now + AGENT_LIST_CACHE_TTL, agents)
+        return agents
     
     def get_agent_info(self, agent_name: str) -> Optional[Dict[str, Any]]:
         """Get detailed info about an agent."""
@@ -885,13 +1602,13 @@ class AgentDaemon:
         if not agent:
             return None
         
+        _require_runtime()
+        
         # Get memory stats
-        from agents.core.runtime.memory import AgentMemory
         memory = AgentMemory(agent_name, self.memory_dir)
         memory_stats = memory.get_stats()
         
         # Get sandbox stats
-        from agents.core.runtime.sandbox import AgentSandbox
         sandbox = AgentSandbox(agent_name, self.sandboxes_dir)
         sandbox_stats = sandbox.get_disk_usage()
         
@@ -911,22 +1628,82 @@ class AgentDaemon:
         limit: int = 50
     ) -> List[Dict[str, Any]]:
         """Get recent logs for an agent."""
+        return list(self.iter_agent_logs(agent_name, limit))
+    
+    def iter_agent_logs(
+        self,
+        agent_name: str,
+        limit: int = 50
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the last ``limit`` log entries for an agent, oldest first.
+        
+        The start of the tail is found by reading the file backwards in
+        LOG_TAIL_CHUNK blocks; entries are then decoded one at a time, so
+        work and memory are bounded by the tail, not the file size
+        (limit <= 0 means everything). Malformed lines are skipped but
+        still count toward the limit.
+        
+        With the sqlite backend the tail is read from the (agent, ts) index
+        instead.
+        """
+        self.flush()
+        
+        db = self._get_log_db()
+        if db is not None:
+            yield from self._iter_agent_logs_db(db, agent_name, limit)
+            return
+        
         log_file = self._get_log_file(agent_name)
         
-        if not log_file.exists():
-            return []
+        try:
+            f = open(log_file, "rb")
+        except FileNotFoundError:
+            return
         
-        logs = []
-        with open(log_file) as f:
+        with f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return
+            
+            if limit > 0:
+                f.seek(_find_tail_start(f, size, limit))
+            
+            # Decode forwards from there
             for line in f:
                 line = line.strip()
                 if line:
                     try:
-                        logs.append(json.loads(line))
-                    except json.JSONDecodeError:
+                        yield json.loads(line)
+                    except (json.JSONDecodeError, UnicodeDecodeError):
                         pass
+    
+    def _iter_agent_logs_db(
+        self,
+        db: sqlite3.Connection,
+        agent_name: str,
+        limit: int
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield the last ``limit`` entries from the sqlite store, oldest first."""
+        with self._log_db_lock:
+            if limit > 0:
+                rows = db.execute(
+                    "SELECT entry FROM log WHERE agent = ? "
+                    "ORDER BY ts DESC, rowid DESC LIMIT ?",
+                    (agent_name, limit)
+                ).fetchall()
+                rows.reverse()
+            else:
+                rows = db.execute(
+                    "SELECT entry FROM log WHERE agent = ? ORDER BY ts, rowid",
+                    (agent_name,)
+                ).fetchall()
         
-        return logs[-limit:]
+        for (entry,) in rows:
+            try:
+                yield json.loads(entry)
+            except json.JSONDecodeError:
+                pass
     
     def run_task(
         self,
@@ -976,12 +1753,12 @@ class AgentDaemon:
                 started_at=started_at,
                 completed_at=datetime.now().isoformat(),
                 error=error,
-                logs=str(self._get_log_file(agent_name))
+                logs=self._get_log_file(agent_name)
             ).to_dict()
         
         self._log_action(
             agent_name, "run_task", "started",
-            details={"task": task, "task_id": task_id, "args": args}
+            details=lambda: {"task": task, "task_id": task_id, "args": args}
         )
         
         # Enforce offline guarantee (Section 7)
@@ -994,10 +1771,7 @@ class AgentDaemon:
             step = TaskStep(step_id=1, action="load_memory", status="running")
             step.started_at = datetime.now().isoformat()
             
-            from agents.core.runtime.memory import AgentMemory
-            from agents.core.runtime.sandbox import AgentSandbox
-            from agents.core.runtime.executor import AgentExecutor
-            
+            _require_runtime()
             memory = AgentMemory(agent_name, self.memory_dir)
             
             # Validate memory size (Section 5)
@@ -1048,7 +1822,7 @@ class AgentDaemon:
             
             step.status = "completed"
             step.completed_at = datetime.now().isoformat()
-            step.capability_checks = agent.capabilities.copy()
+            step.capability_checks = agent._cap_tuple
             steps.append(step)
             
             # Step 5: Parse and execute task
@@ -1103,7 +1877,7 @@ class AgentDaemon:
                 completed_at=datetime.now().isoformat(),
                 steps=steps,
                 result=result,
-                logs=str(self._get_log_file(agent_name))
+                logs=self._get_log_file(agent_name)
             ).to_dict()
             
         except AgentException as e:
@@ -1126,11 +1900,11 @@ class AgentDaemon:
                 completed_at=datetime.now().isoformat(),
                 steps=steps,
                 error=e.agent_error,
-                logs=str(self._get_log_file(agent_name))
+                logs=self._get_log_file(agent_name)
             ).to_dict()
             
         except Exception as e:
-            logger.exception(f"Task failed: {e}")
+            logger.exception("Task failed: %s", e)
             # Emit swarm failure signal
             self._emit_swarm_signal(
                 agent_name, task,
@@ -1155,8 +1929,12 @@ class AgentDaemon:
                 completed_at=datetime.now().isoformat(),
                 steps=steps,
                 error=error,
-                logs=str(self._get_log_file(agent_name))
+                logs=self._get_log_file(agent_name)
             ).to_dict()
+        
+        finally:
+            # The task's log entries are on disk once run_task returns
+            self.flush()
     
     def _execute_task(
         self,
@@ -1177,14 +1955,9 @@ class AgentDaemon:
         - Validate filesystem paths before reading/writing
         - Log every decision and action
         """
-        from agents.skills.loader import SkillLoader
-        
         # Check if task is a skill.function call
-        if "." in task and " " not in task:
-            parts = task.split(".", 1)
-            skill_name = parts[0]
-            func_name = parts[1] if len(parts) > 1 else None
-            
+        skill_name, sep, func_name = task.partition(".")
+        if sep and " " not in task:
             # Validate skill is allowed for this agent (Section 3)
             valid, error = self._validate_skill_for_agent(agent, skill_name)
             if not valid:
@@ -1194,8 +1967,6 @@ class AgentDaemon:
                 }
             
             # Load and run skill
-            loader = SkillLoader(self.skills_dir)
-            
             try:
                 skill = self._load_skill_for_agent(
                     agent, skill_name, executor, sandbox, memory
@@ -1212,14 +1983,19 @@ class AgentDaemon:
                     f"skill_call:{skill_name}.{func_name}",
                     "executing",
                     skill_loads=[skill_name],
-                    details={"function": func_name, "args": args}
+                    details=lambda: {"function": func_name, "args": args}
                 )
-                result = skill.call(func_name, **args)
+                try:
+                    result = skill.call(func_name, **args)
+                finally:
+                    self._release_skill(agent, skill_name, skill)
                 return result.to_dict()
             else:
+                manifest = skill.get_manifest()
+                self._release_skill(agent, skill_name, skill)
                 return {
                     "success": True,
-                    "data": skill.get_manifest()
+                    "data": manifest
                 }
         
         # Natural language task - return guidance
@@ -1230,11 +2006,11 @@ class AgentDaemon:
                     "Use skill.function format (e.g., 'pkg.install_package')",
             "available_skills": agent.skills,
             "example_tasks": [
-                f"{s}.self_test" for s in agent.skills[:3]
+                f"{s}.self_test" for s in agent._skills_preview
             ]
         }
     
-    def validate_all(self) -> Dict[str, Any]:
+    def validate_all(self, deep: bool = False, use_cache: bool = True) -> Dict[str, Any]:
         """
         Validate all agents and skills.
         
@@ -1243,129 +2019,300 @@ class AgentDaemon:
         - Skill existence and manifest validation
         - Sandbox integrity
         - Memory file validation
+        
+        Args:
+            deep: Also import every skill module and resolve its Skill
+                class. The default fast pass only checks manifests and
+                that each skill's entrypoint file exists.
+            use_cache: Reuse the previous run's result for skills whose
+                manifest and entrypoint files are unchanged (size, mtime,
+                mode). Results are always written back to the cache.
         """
         results = {
             "agents": {},
             "skills": {},
             "sandboxes": {},
-            "memory": {},
-            "errors": [],
-            "summary": {
-                "agents_valid": 0,
-                "agents_invalid": 0,
-                "skills_valid": 0,
-                "skills_invalid": 0
-            }
+            "memory": {}
         }
-        
-        # Validate agents
-        for name, agent in self._agents.items():
-            agent_result = {
-                "valid": True,
-                "issues": [],
-                "capabilities": agent.capabilities,
-                "skills": agent.skills
-            }
-            
-            # Check capabilities are known
-            all_caps = self._get_all_capability_names()
-            for cap in agent.capabilities:
-                if cap not in all_caps:
-                    agent_result["issues"].append(f"Unknown capability: {cap}")
-            
-            # Check skills exist
-            for skill in agent.skills:
-                skill_dir = self.skills_dir / skill
-                if not skill_dir.exists():
-                    agent_result["issues"].append(f"Missing skill: {skill}")
-                else:
-                    # Check skill manifest
-                    manifest = self._get_skill_manifest(skill)
-                    if not manifest:
-                        agent_result["issues"].append(f"Missing manifest for skill: {skill}")
-                    else:
-                        # Check agent has required capabilities for skill
-                        req_caps = manifest.get("requires_capabilities", [])
-                        for cap in req_caps:
-                            if cap not in agent.capabilities:
-                                agent_result["issues"].append(
-                                    f"Skill '{skill}' requires '{cap}' but agent lacks it"
-                                )
-            
-            # Validate sandbox
-            sandbox_root = self.sandboxes_dir / name
-            if sandbox_root.exists():
-                results["sandboxes"][name] = {
-                    "exists": True,
-                    "path": str(sandbox_root)
-                }
-            else:
-                results["sandboxes"][name] = {
-                    "exists": False,
-                    "path": str(sandbox_root)
-                }
-            
-            # Validate memory
-            memory_file = self.memory_dir / f"{name}.json"
-            if memory_file.exists():
-                size = memory_file.stat().st_size
-                mem_ok, _ = self._check_memory_size(agent, memory_file)
-                results["memory"][name] = {
-                    "exists": True,
-                    "size_bytes": size,
-                    "within_limit": mem_ok,
-                    "limit_bytes": agent.max_memory_bytes
-                }
-            else:
-                results["memory"][name] = {
-                    "exists": False,
-                    "size_bytes": 0,
-                    "within_limit": True,
-                    "limit_bytes": agent.max_memory_bytes
-                }
-            
-            agent_result["valid"] = len(agent_result["issues"]) == 0
+        errors: List[str] = []
+        agents_valid = agents_invalid = skills_valid = skills_invalid = 0
+        
+        loader = self._get_skill_loader()
+        
+        # Parse each manifest at most once for the whole pass
+        skill_names = loader.discover_skills()
+        manifests = {s: self._get_skill_manifest_entry(s) for s in skill_names}
+        
+        all_caps = self._get_all_capability_names()
+        
+        # One readdir per directory instead of a stat per agent (or skill)
+        skill_entries = self._scan_dir(self.skills_dir)
+        sandbox_entries = self._scan_dir(self.sandboxes_dir)
+        memory_entries = self._scan_dir(self.memory_dir)
+        
+        # Validate agents concurrently to overlap their filesystem checks;
+        # map() keeps results in agent order
+        agents = list(self._agents.items())
+        with ThreadPoolExecutor(max_workers=max(1, min(32, len(agents)))) as pool:
+            agent_results = list(pool.map(
+                lambda item: self._validate_single_agent(
+                    item[0], item[1], manifests, all_caps,
+                    skill_entries, sandbox_entries, memory_entries
+                ),
+                agents
+            ))
+        
+        for name, agent_result, sandbox_result, memory_result in agent_results:
             results["agents"][name] = agent_result
+            results["sandboxes"][name] = sandbox_result
+            results["memory"][name] = memory_result
             
             if agent_result["valid"]:
-                results["summary"]["agents_valid"] += 1
+                agents_valid += 1
             else:
-                results["summary"]["agents_invalid"] += 1
-        
-        # Validate skills
-        from agents.skills.loader import SkillLoader
-        loader = SkillLoader(self.skills_dir)
-        
-        for skill_name in loader.discover_skills():
-            skill_result = {
-                "valid": True,
-                "issues": [],
-                "manifest": None
-            }
+                agents_invalid += 1
+        
+        # Validate skills, reusing cached results for unchanged skills
+        mode = "deep" if deep else "fast"
+        validate_cache = self._load_validate_cache()
+        previous = validate_cache.get(mode, {}) if use_cache else {}
+        skill_cache: Dict[str, Any] = {}
+        
+        for skill_name in skill_names:
+            entry = manifests[skill_name]
+            manifest = entry[0] if entry else None
+            entrypoint = (manifest or {}).get("entrypoint", "skill.py")
+            stat_key = self._skill_stat_key(skill_name, entrypoint)
             
-            manifest = loader.load_manifest(skill_name)
-            if not manifest:
-                skill_result["issues"].append("No manifest file")
+            cached = previous.get(skill_name)
+            if isinstance(cached, dict) and cached.get("key") == stat_key:
+                skill_result = cached["result"]
             else:
-                skill_result["manifest"] = manifest
-            
-            skill_class = loader.load_skill_class(skill_name)
-            if not skill_class:
-                skill_result["issues"].append("Failed to load skill class")
+                skill_result = {
+                    "valid": True,
+                    "issues": [],
+                    "manifest": None
+                }
+                
+                if not manifest:
+                    skill_result["issues"].append("No manifest file")
+                else:
+                    skill_result["manifest"] = manifest
+                
+                if deep:
+                    skill_class = loader.load_skill_class(skill_name)
+                    if not skill_class:
+                        skill_result["issues"].append("Failed to load skill class")
+                else:
+                    if not os.path.isfile(self.skills_dir / skill_name / entrypoint):
+                        skill_result["issues"].append(_ISSUE_MISSING_ENTRYPOINT.format(e=entrypoint))
+                
+                skill_result["valid"] = len(skill_result["issues"]) == 0
             
-            skill_result["valid"] = len(skill_result["issues"]) == 0
+            skill_cache[skill_name] = {"key": stat_key, "result": skill_result}
             results["skills"][skill_name] = skill_result
             
             if skill_result["valid"]:
-                results["summary"]["skills_valid"] += 1
+                skills_valid += 1
             else:
-                results["summary"]["skills_invalid"] += 1
+                skills_invalid += 1
+        
+        validate_cache[mode] = skill_cache
+        self._save_validate_cache(validate_cache)
         
+        results["errors"] = errors
+        results["summary"] = {
+            "agents_valid": agents_valid,
+            "agents_invalid": agents_invalid,
+            "skills_valid": skills_valid,
+            "skills_invalid": skills_invalid
+        }
         return results
     
-    def _get_all_capability_names(self) -> set:
-        """Get all known capability names."""
-        caps = KNOWN_CAPABILITIES.copy()
+    def _validate_single_agent(
+        self,
+        name: str,
+        agent: AgentConfig,
+        manifests: Dict[str, Optional[Tuple[Dict[str, Any], FrozenSet[str]]]],
+        all_caps: FrozenSet[str],
+        skill_entries: Dict[str, os.DirEntry],
+        sandbox_entries: Dict[str, os.DirEntry],
+        memory_entries: Dict[str, os.DirEntry]
+    ) -> Tuple[str, Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+        """
+        Validate one agent for validate_all.
+        
+        Returns:
+            (name, agent result, sandbox result, memory result)
+        """
+        agent_result = {
+            "valid": True,
+            "issues": [],
+            "capabilities": agent.capabilities,
+            "skills": agent.skills
+        }
+        
+        agent_caps = agent._cap_set
+        
+        # Check capabilities are known
+        if agent_caps - all_caps:
+            agent_result["issues"].extend(
+                _ISSUE_UNKNOWN_CAP.format(c=cap)
+                for cap in agent.capabilities
+                if cap not in all_caps
+            )
+        
+        # Check skills exist (a dangling symlink does not count)
+        for skill in agent.skills:
+            skill_entry = skill_entries.get(skill)
+            if skill_entry is None or (
+                skill_entry.is_symlink() and not os.path.exists(skill_entry.path)
+            ):
+                agent_result["issues"].append(_ISSUE_MISSING_SKILL.format(s=skill))
+            else:
+                # Check skill manifest
+                if skill not in manifests:
+                    manifests[skill] = self._get_skill_manifest_entry(skill)
+                entry = manifests[skill]
+                if not entry or not entry[0]:
+                    agent_result["issues"].append(_ISSUE_MISSING_MANIFEST.format(s=skill))
+                else:
+                    # Check agent has required capabilities for skill
+                    manifest, required = entry
+                    missing = required - agent_caps
+                    if missing:
+                        # Report in manifest order for stable output
+                        agent_result["issues"].extend(
+                            _ISSUE_MISSING_CAP.format(s=skill, c=cap)
+                            for cap in manifest.get("requires_capabilities", [])
+                            if cap in missing
+                        )
+        
+        agent_result["valid"] = len(agent_result["issues"]) == 0
+        
+        # Validate sandbox
+        sandbox_result = {
+            "exists": name in sandbox_entries,
+            "path": str(self.sandboxes_dir / name)
+        }
+        
+        # Validate memory
+        memory_entry = memory_entries.get(f"{name}.json")
+        size = memory_entry.stat(follow_symlinks=False).st_size if memory_entry else 0
+        memory_result = {
+            "exists": memory_entry is not None,
+            "size_bytes": size,
+            "within_limit": size <= agent.max_memory_bytes,
+            "limit_bytes": agent.max_memory_bytes
+        }
+        
+        return name, agent_result, sandbox_result, memory_result
+    
+    def _skill_stat_key(self, skill_name: str, entrypoint: str) -> List[List[Any]]:
+        """(name, size, mtime, mode) of a skill's manifest and entrypoint files."""
+        skill_dir = os.path.join(self.skills_dir, skill_name)
+        key = []
+        for filename in ("skill.yml", "skill.yaml", "skill.json", entrypoint):
+            try:
+                st = os.stat(os.path.join(skill_dir, filename))
+            except OSError:
+                continue
+            key.append([filename, st.st_size, st.st_mtime_ns, st.st_mode])
+        return key
+    
+    def _load_validate_cache(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Load per-skill results persisted by previous validate_all runs.
+        
+        Returns:
+            {"fast": {skill: entry}, "deep": {skill: entry}}
+        """
+        try:
+            with open(self.validate_cache_file) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = None
+        
+        if not isinstance(data, dict) or data.get("version") != VALIDATE_CACHE_VERSION:
+            data = {}
+        return {
+            mode: data[mode] if isinstance(data.get(mode), dict) else {}
+            for mode in ("fast", "deep")
+        }
+    
+    def _save_validate_cache(self, cache: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Persist per-skill validate_all results.
+        
+        Serialized on the calling thread (the results are handed back to
+        the caller), then written and atomically renamed in the background.
+        At most one writer runs; a save made while it is busy replaces the
+        payload it writes next, so only the latest results reach disk.
+        """
+        try:
+            payload = json.dumps({"version": VALIDATE_CACHE_VERSION, **cache}, default=str)
+        except (TypeError, ValueError) as e:
+            logger.debug("Validate cache not serializable: %s", e)
+            return
+        
+        with self._validate_cache_lock:
+            self._validate_cache_payload = payload
+            if self._validate_cache_writer is not None:
+                return
+            writer = self._validate_cache_writer = Thread(
+                target=self._validate_cache_write_loop,
+                name="agentd-validate-cache"
+            )
+        writer.start()
+    
+    def _validate_cache_write_loop(self) -> None:
+        """Writer thread: write pending validate cache payloads until none is left."""
+        while True:
+            with self._validate_cache_lock:
+                payload = self._validate_cache_payload
+                self._validate_cache_payload = None
+                if payload is None:
+                    self._validate_cache_writer = None
+                    return
+            
+            cache_file = self.validate_cache_file
+            tmp_file = None
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                # A unique temp file, so other processes' writers never share it
+                fd, tmp_file = tempfile.mkstemp(
+                    prefix=f".{cache_file.name}.", suffix=".tmp", dir=cache_file.parent
+                )
+                with os.fdopen(fd, "w") as f:
+                    f.write(payload)
+                os.replace(tmp_file, cache_file)
+            except OSError as e:
+                logger.debug("Failed to write validate cache: %s", e)
+                if tmp_file is not None:
+                    try:
+                        os.unlink(tmp_file)
+                    except OSError:
+                        pass
+    
+    @staticmethod
+    def _scan_dir(directory: Path) -> Dict[str, os.DirEntry]:
+        """Map entry names to DirEntry objects (empty if directory is missing)."""
+        try:
+            with os.scandir(directory) as it:
+                return {entry.name: entry for entry in it}
+        except (FileNotFoundError, NotADirectoryError):
+            return {}
+    
+    def _get_all_capability_names(self) -> FrozenSet[str]:
+        """
+        Get all known capability names.
+        
+        Cached until self.capabilities is reloaded (which resets the cache).
+        """
+        if self._all_caps_cache is not None:
+            return self._all_caps_cache
+        
+        caps = set(KNOWN_CAPABILITIES)
         
         cap_data = self.capabilities.get("capabilities", {})
         for category, items in cap_data.items():
@@ -1379,15 +2326,17 @@ class AgentDaemon:
             if isinstance(preset_caps, list):
                 caps.update(preset_caps)
         
-        return caps
+        self._all_caps_cache = frozenset(caps)
+        return self._all_caps_cache
     
     # =========================================================================
     # SECTION: Public API Methods
     # =========================================================================
     
+    @_require_agent(_capability_not_found)
     def check_agent_capability(
         self,
-        agent_name: str,
+        agent: AgentConfig,
         capability: str
     ) -> Dict[str, Any]:
         """
@@ -1395,28 +2344,18 @@ class AgentDaemon:
         
         Returns structured result with allowed/denied status.
         """
-        agent = self._agents.get(agent_name)
-        if not agent:
-            return {
-                "allowed": False,
-                "error": AgentError(
-                    error_type=AgentErrorType.UNKNOWN_ERROR,
-                    message=f"Agent not found: {agent_name}",
-                    agent=agent_name
-                ).to_dict()
-            }
-        
         has_cap, error = self._check_capability(agent, capability)
         return {
             "allowed": has_cap,
             "capability": capability,
-            "agent": agent_name,
+            "agent": agent.name,
             "error": error.to_dict() if error else None
         }
     
+    @_require_agent(_access_not_found)
     def check_sandbox_access(
         self,
-        agent_name: str,
+        agent: AgentConfig,
         path: str
     ) -> Dict[str, Any]:
         """
@@ -1424,25 +2363,19 @@ class AgentDaemon:
         
         Enforces sandbox boundaries (Section 4).
         """
-        agent = self._agents.get(agent_name)
-        if not agent:
-            return {
-                "allowed": False,
-                "error": "Agent not found"
-            }
-        
-        allowed, error = self._check_sandbox_boundary(agent, Path(path))
+        allowed, error = self._check_sandbox_boundary(agent, path)
         return {
             "allowed": allowed,
             "path": path,
-            "agent": agent_name,
-            "sandbox": str(self.sandboxes_dir / agent_name),
+            "agent": agent.name,
+            "sandbox": self._get_sandbox_path(agent.name),
             "error": error.to_dict() if error else None
         }
     
+    @_require_agent(_access_not_found)
     def check_network_access(
         self,
-        agent_name: str,
+        agent: AgentConfig,
         target: Optional[str] = None
     ) -> Dict[str, Any]:
         """
@@ -1450,48 +2383,35 @@ class AgentDaemon:
         
         Enforces offline guarantee (Section 7).
         """
-        agent = self._agents.get(agent_name)
-        if not agent:
-            return {
-                "allowed": False,
-                "error": "Agent not found"
-            }
-        
         allowed, error = self._check_network_access(agent, target)
         return {
             "allowed": allowed,
             "target": target,
-            "agent": agent_name,
+            "agent": agent.name,
             "has_network_local": agent.has_capability("network.local"),
             "has_network_external": agent.has_capability("network.external"),
             "is_blocked": agent.is_network_blocked(),
             "error": error.to_dict() if error else None
         }
     
-    def get_agent_sandbox(self, agent_name: str) -> Optional[Dict[str, Any]]:
+    @_require_agent(_none_not_found)
+    def get_agent_sandbox(self, agent: AgentConfig) -> Optional[Dict[str, Any]]:
         """Get sandbox information for an agent."""
-        agent = self._agents.get(agent_name)
-        if not agent:
-            return None
-        
-        from agents.core.runtime.sandbox import AgentSandbox
-        sandbox = AgentSandbox(agent_name, self.sandboxes_dir)
+        _require_runtime()
+        sandbox = AgentSandbox(agent.name, self.sandboxes_dir)
         return sandbox.get_disk_usage()
     
-    def clean_agent_sandbox(self, agent_name: str) -> Dict[str, Any]:
+    @_require_agent(_clean_not_found)
+    def clean_agent_sandbox(self, agent: AgentConfig) -> Dict[str, Any]:
         """Clean an agent's sandbox (tmp and work directories)."""
-        agent = self._agents.get(agent_name)
-        if not agent:
-            return {"success": False, "error": "Agent not found"}
-        
-        from agents.core.runtime.sandbox import AgentSandbox
-        sandbox = AgentSandbox(agent_name, self.sandboxes_dir)
+        _require_runtime()
+        sandbox = AgentSandbox(agent.name, self.sandboxes_dir)
         
         tmp_cleaned = sandbox.clean_tmp()
         work_cleaned = sandbox.clean_work()
         
         self._log_action(
-            agent_name,
+            agent.name,
             "sandbox_clean",
             "completed",
             details={"tmp_removed": tmp_cleaned, "work_removed": work_cleaned}
@@ -1504,8 +2424,18 @@ class AgentDaemon:
         }
     
     def get_system_status(self) -> Dict[str, Any]:
-        """Get overall system status."""
-        return {
+        """
+        Get overall system status.
+        
+        Memoized for STATUS_CACHE_TTL seconds; callers must not mutate the
+        returned dict.
+        """
+        now = time.monotonic()
+        expires_at, status = self._status_cache
+        if now < expires_at:
+            return status
+        
+        status = {
             "agents_root": str(self.agents_root),
             "agents_loaded": len(self._agents),
             "agent_names": list(self._agents.keys()),
@@ -1516,22 +2446,40 @@ class AgentDaemon:
             "offline_mode": True,
             "version": "1.0.0"
         }
+        self._status_cache = (now + STATUS_CACHE_TTL, status)
+        return status
 
 
 # =============================================================================
 # SECTION: Singleton and Convenience Functions
 # =============================================================================
 
-# Singleton instance
-_daemon: Optional[AgentDaemon] = None
+# One daemon per agents root (None = default root); misses are serialized
+_daemons: Dict[str, AgentDaemon] = {}
+_daemons_lock = Lock()
 
 
 def get_daemon(agents_root: Optional[Path] = None) -> AgentDaemon:
-    """Get or create the agent daemon singleton."""
-    global _daemon
-    if _daemon is None:
-        _daemon = AgentDaemon(agents_root)
-    return _daemon
+    """
+    Get or create the agent daemon for ``agents_root``.
+    
+    Lookups are a plain dict hit; the first call for a root builds the
+    daemon under a lock, so concurrent first calls never build two.
+    Roots are keyed by absolute path, so None, the default root spelled
+    out, and relative or trailing-slash spellings share one daemon.
+    """
+    root = Path(agents_root) if agents_root else _default_agents_root()
+    key = os.path.abspath(root)
+    try:
+        return _daemons[key]
+    except KeyError:
+        pass
+    
+    with _daemons_lock:
+        daemon = _daemons.get(key)
+        if daemon is None:
+            daemon = _daemons[key] = AgentDaemon(root)
+        return daemon
 
 
 def run_task(agent_name: str, task: str, args: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -1569,9 +2517,9 @@ def check_network(agent_name: str, target: Optional[str] = None) -> Dict[str, An
     return get_daemon().check_network_access(agent_name, target)
 
 
-def validate_all() -> Dict[str, Any]:
+def validate_all(deep: bool = False, use_cache: bool = True) -> Dict[str, Any]:
     """Convenience function to validate all agents and skills."""
-    return get_daemon().validate_all()
+    return get_daemon().validate_all(deep, use_cache)
 
 
 def get_status() -> Dict[str, Any]:
@@ -1583,7 +2531,8 @@ def get_status() -> Dict[str, Any]:
 # SECTION: CLI Interface
 # =============================================================================
 
-if __name__ == "__main__":
+def main() -> None:
+    """Command-line entry point (argparse is only imported here)."""
     import argparse
     
     parser = argparse.ArgumentParser(
@@ -1595,6 +2544,8 @@ Examples:
   python agentd.py info --agent build      Get agent info
   python agentd.py run -a build -t pkg.self_test
   python agentd.py validate                Validate all agents and skills
+  python agentd.py validate --deep         Also import every skill class
+  python agentd.py validate --no-cache     Revalidate unchanged skills too
   python agentd.py status                  Get system status
   python agentd.py check-cap -a build -c exec.pkg
   python agentd.py check-sandbox -a build -p /tmp/test
@@ -1622,15 +2573,30 @@ Examples:
     parser.add_argument("--limit", "-n", type=int, default=50, help="Log limit")
     parser.add_argument("--root", "-r", help="Agents root directory")
     parser.add_argument("--json", "-j", action="store_true", help="Output as JSON")
+    parser.add_argument("--deep", action="store_true",
+                        help="validate: also import and check skill classes")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="validate: ignore cached results of unchanged skills")
     
     args = parser.parse_args()
     
     daemon = AgentDaemon(Path(args.root) if args.root else None)
     
+    if HAS_ORJSON:
+        def _dumps(data):
+            return orjson.dumps(
+                data,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                default=str
+            ).decode()
+    else:
+        def _dumps(data):
+            return json.dumps(data, indent=2, default=str)
+    
     def output(data, as_json=False):
         """Output data as JSON or formatted text."""
         if as_json or args.json:
-            print(json.dumps(data, indent=2, default=str))
+            print(_dumps(data))
         else:
             if isinstance(data, dict):
                 for k, v in data.items():
@@ -1645,17 +2611,29 @@ Examples:
                 print(data)
     
     if args.command == "list":
-        agents = daemon.list_agents()
         if args.json:
-            output(agents, True)
+            output(daemon.list_agents(), True)
         else:
-            print(f"{'Name':<20} {'Description':<50} {'Skills'}")
-            print("-" * 90)
-            for agent in agents:
-                skills = ", ".join(agent.get("skills", [])[:3])
-                if len(agent.get("skills", [])) > 3:
-                    skills += "..."
-                print(f"{agent['name']:<20} {agent['description'][:50]:<50} {skills}")
+            agents = list(daemon._agents.values())
+            
+            # Size columns to the data (descriptions are capped at 50)
+            name_w = max([len("Name")] + [len(a.name) for a in agents]) + 1
+            desc_w = max(
+                [len("Description")] + [len(a.description[:50]) for a in agents]
+            ) + 1
+            
+            def _row(agent: AgentConfig) -> str:
+                return (
+                    f"{agent.name:<{name_w}} {agent.description[:50]:<{desc_w}} "
+                    f"{agent._skills_preview_str}"
+                )
+            
+            header = f"{'Name':<{name_w}} {'Description':<{desc_w}} Skills"
+            sys.stdout.write("\n".join([
+                header,
+                "-" * (name_w + desc_w + 8),
+                *map(_row, agents),
+            ]) + "\n")
     
     elif args.command == "info":
         if not args.agent:
@@ -1685,7 +2663,7 @@ Examples:
         output(result, True)
     
     elif args.command == "validate":
-        result = daemon.validate_all()
+        result = daemon.validate_all(deep=args.deep, use_cache=not args.no_cache)
         output(result, True)
     
     elif args.command == "status":
@@ -1717,17 +2695,23 @@ Examples:
         if not args.agent:
             print("Error: --agent required")
             sys.exit(1)
-        logs = daemon.get_agent_logs(args.agent, args.limit)
         if args.json:
-            output(logs, True)
+            output(daemon.get_agent_logs(args.agent, args.limit), True)
         else:
-            for log in logs:
+            # Write in batches: one stdout write per LOG_WRITE_BATCH entries
+            # while still streaming long logs
+            rows = []
+            for log in daemon.iter_agent_logs(args.agent, args.limit):
                 ts = log.get("timestamp", "")[:19]
                 action = log.get("action", "")
                 status = log.get("status", "")
-                print(f"[{ts}] {action}: {status}")
+                rows.append(f"[{ts}] {action}: {status}\n")
                 if log.get("error"):
-                    print(f"  ERROR: {log['error']}")
+                    rows.append(f"  ERROR: {log['error']}\n")
+                if len(rows) >= LOG_WRITE_BATCH:
+                    sys.stdout.write("".join(rows))
+                    rows.clear()
+            sys.stdout.write("".join(rows))
     
     elif args.command == "clean":
         if not args.agent:
@@ -1735,3 +2719,7 @@ Examples:
             sys.exit(1)
         result = daemon.clean_agent_sandbox(args.agent)
         output(result, True)
+
+
+if __name__ == "__main__":
+    main()
@@ -11,13 +11,15 @@ Key concepts:
 - Emergence: Complex behavior from simple local rules
 """
 
-from .swarm import SwarmCoordinator, Signal, SignalType
+from .swarm import SwarmCoordinator, SwarmSnapshot, Signal, SignalType, get_coordinator
 from .signals import SignalEmitter, SignalSensor
 
 __all__ = [
     'SwarmCoordinator',
+    'SwarmSnapshot',
     'Signal', 
     'SignalType',
+    'get_coordinator',
     'SignalEmitter',
     'SignalSensor'
 ]
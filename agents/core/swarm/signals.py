@@ -9,9 +9,19 @@ SignalSensor: Pattern-based signal detection for decision making
 """
 
 import time
+from collections import defaultdict
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
-from .swarm import SwarmCoordinator, Signal, SignalType
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from .swarm import SwarmCoordinator, SwarmSnapshot, Signal, SignalType, get_coordinator
+
+# Signal type groups queried by SignalSensor
+_ACTIVE_TYPES = frozenset({SignalType.CLAIMING, SignalType.WORKING})
+_SUCCESS_TYPES = frozenset({SignalType.SUCCESS, SignalType.PATH_CLEAR,
+                            SignalType.OPTIMIZED})
+_FAILURE_TYPES = frozenset({SignalType.FAILURE, SignalType.BLOCKED})
+_DISCOVERY_TYPES = frozenset({SignalType.LEARNED, SignalType.OPTIMIZED,
+                              SignalType.RESOURCE_FOUND})
 
 
 class SignalEmitter:
@@ -27,10 +37,45 @@ class SignalEmitter:
     def __init__(self, coordinator: SwarmCoordinator, agent_name: str):
         self.coordinator = coordinator
         self.agent_name = agent_name
+        self._pending: Optional[List[Dict[str, Any]]] = None
+    
+    def _emit(self, **kwargs) -> Optional[Signal]:
+        """Emit now, or buffer the signal while inside batch()."""
+        if self._pending is not None:
+            self._pending.append(kwargs)
+            return None
+        return self.coordinator.emit(**kwargs)
+    
+    @contextmanager
+    def batch(self) -> Iterator[List[Signal]]:
+        """
+        Buffer report_* calls and emit them together on exit.
+        
+        Inside the block the report_* methods return None; the yielded
+        list is filled with the emitted signals when the block exits.
+        
+        Usage:
+            with emitter.batch() as signals:
+                emitter.report_working("pkg.build")
+                emitter.report_success("pkg.install")
+        """
+        if self._pending is not None:
+            # Nested batch: the outer one emits everything
+            yield []
+            return
+        
+        self._pending = pending = []
+        emitted: List[Signal] = []
+        try:
+            yield emitted
+        finally:
+            self._pending = None
+            if pending:
+                emitted.extend(self.coordinator.emit_many(pending))
     
     def report_success(self, target: str, details: Dict[str, Any] = None) -> Signal:
         """Report successful completion of a task/skill."""
-        return self.coordinator.emit(
+        return self._emit(
             signal_type=SignalType.SUCCESS,
             source_agent=self.agent_name,
             target=target,
@@ -40,7 +85,7 @@ class SignalEmitter:
     def report_failure(self, target: str, error: str = None, 
                        recoverable: bool = True) -> Signal:
         """Report failure on a task/skill."""
-        return self.coordinator.emit(
+        return self._emit(
             signal_type=SignalType.FAILURE,
             source_agent=self.agent_name,
             target=target,
@@ -53,7 +98,7 @@ class SignalEmitter:
     
     def report_blocked(self, target: str, reason: str = None) -> Signal:
         """Report that a path/approach is blocked."""
-        return self.coordinator.emit(
+        return self._emit(
             signal_type=SignalType.BLOCKED,
             source_agent=self.agent_name,
             target=target,
@@ -64,7 +109,7 @@ class SignalEmitter:
     def report_danger(self, target: str, severity: str = "high",
                       description: str = None) -> Signal:
         """Report dangerous condition (data loss, system instability, etc.)."""
-        return self.coordinator.emit(
+        return self._emit(
             signal_type=SignalType.DANGER,
             source_agent=self.agent_name,
             target=target,
@@ -79,7 +124,7 @@ class SignalEmitter:
     
     def claim_task(self, target: str, estimated_duration: int = 60) -> Signal:
         """Claim exclusive work on a task."""
-        return self.coordinator.emit(
+        return self._emit(
             signal_type=SignalType.CLAIMING,
             source_agent=self.agent_name,
             target=target,
@@ -92,7 +137,7 @@ class SignalEmitter:
     
     def release_task(self, target: str, reason: str = "completed") -> Signal:
         """Release claim on a task."""
-        return self.coordinator.emit(
+        return self._emit(
             signal_type=SignalType.RELEASING,
             source_agent=self.agent_name,
             target=target,
@@ -102,7 +147,7 @@ class SignalEmitter:
     
     def report_working(self, target: str) -> Signal:
         """Report that agent is actively working on something."""
-        return self.coordinator.emit(
+        return self._emit(
             signal_type=SignalType.WORKING,
             source_agent=self.agent_name,
             target=target,
@@ -113,7 +158,7 @@ class SignalEmitter:
     def request_help(self, target: str, problem: str = None,
                      needed_capabilities: List[str] = None) -> Signal:
         """Request help from other agents."""
-        return self.coordinator.emit(
+        return self._emit(
             signal_type=SignalType.HELP_NEEDED,
             source_agent=self.agent_name,
             target=target,
@@ -129,7 +174,7 @@ class SignalEmitter:
     def share_discovery(self, target: str, discovery_type: str,
                         details: Dict[str, Any] = None) -> Signal:
         """Share a discovery with the swarm (new pattern, resource, etc.)."""
-        return self.coordinator.emit(
+        return self._emit(
             signal_type=SignalType.LEARNED,
             source_agent=self.agent_name,
             target=target,
@@ -144,7 +189,7 @@ class SignalEmitter:
     def report_optimization(self, target: str, improvement: str,
                            metrics: Dict[str, Any] = None) -> Signal:
         """Report an optimization/improvement to an approach."""
-        return self.coordinator.emit(
+        return self._emit(
             signal_type=SignalType.OPTIMIZED,
             source_agent=self.agent_name,
             target=target,
@@ -158,7 +203,7 @@ class SignalEmitter:
     def mark_deprecated(self, target: str, reason: str,
                        replacement: str = None) -> Signal:
         """Mark something as deprecated (old skill, broken approach, etc.)."""
-        return self.coordinator.emit(
+        return self._emit(
             signal_type=SignalType.DEPRECATED,
             source_agent=self.agent_name,
             target=target,
@@ -174,7 +219,7 @@ class SignalEmitter:
                        location: str = None, 
                        metadata: Dict[str, Any] = None) -> Signal:
         """Report finding a useful resource."""
-        return self.coordinator.emit(
+        return self._emit(
             signal_type=SignalType.RESOURCE_FOUND,
             source_agent=self.agent_name,
             target=target,
@@ -195,21 +240,29 @@ class SignalSensor:
     - Check if task is claimed
     - Get recommendations for a skill
     - Find help requests matching capabilities
+    
+    Query methods accept an optional ``snapshot`` (see
+    SwarmCoordinator.snapshot) so a batch of checks shares one scan.
     """
     
     def __init__(self, coordinator: SwarmCoordinator, agent_name: str):
         self.coordinator = coordinator
         self.agent_name = agent_name
     
-    def is_task_claimed(self, target: str) -> Tuple[bool, Optional[str]]:
+    def _source(self, snapshot: Optional[SwarmSnapshot]):
+        """Answer queries from the snapshot when given, else the live swarm."""
+        return snapshot if snapshot is not None else self.coordinator
+    
+    def is_task_claimed(self, target: str,
+                        snapshot: Optional[SwarmSnapshot] = None) -> Tuple[bool, Optional[str]]:
         """
         Check if a task is claimed by another agent.
         
         Returns:
             (is_claimed, claiming_agent) tuple
         """
-        claims = self.coordinator.sense(
-            signal_types=[SignalType.CLAIMING, SignalType.WORKING],
+        claims = self._source(snapshot).sense(
+            signal_types=_ACTIVE_TYPES,
             target=target,
             min_strength=0.3
         )
@@ -224,10 +277,13 @@ class SignalSensor:
         """
         Get recommendation on whether to proceed with a task.
         
-        Combines consensus with claim checking.
+        Combines consensus with claim checking, both answered from one
+        snapshot of the swarm.
         """
+        snapshot = self.coordinator.snapshot()
+        
         # Check claims
-        is_claimed, claimer = self.is_task_claimed(target)
+        is_claimed, claimer = self.is_task_claimed(target, snapshot)
         if is_claimed:
             return {
                 "proceed": False,
@@ -236,7 +292,7 @@ class SignalSensor:
             }
         
         # Get consensus
-        consensus = self.coordinator.get_consensus(target)
+        consensus = self.coordinator.get_consensus(target, snapshot)
         
         if consensus["sentiment"] == "negative" and consensus["confidence"] > 0.5:
             return {
@@ -262,14 +318,18 @@ class SignalSensor:
         }
     
     def find_help_requests(self, 
-                          capabilities: List[str] = None) -> List[Signal]:
+                          capabilities: List[str] = None,
+                          snapshot: Optional[SwarmSnapshot] = None) -> List[Signal]:
         """
         Find help requests that match agent's capabilities.
         
         Args:
             capabilities: List of capabilities this agent has
         """
-        help_signals = self.coordinator.sense(
+        if capabilities and snapshot is None:
+            return self.coordinator.help_requests(capabilities)
+        
+        help_signals = self._source(snapshot).sense(
             signal_types=[SignalType.HELP_NEEDED],
             min_strength=0.2
         )
@@ -286,74 +346,71 @@ class SignalSensor:
         
         return matching
     
-    def get_successful_approaches(self, target: str) -> List[Signal]:
+    def get_successful_approaches(self, target: str,
+                                  snapshot: Optional[SwarmSnapshot] = None) -> List[Signal]:
         """Get signals about successful approaches for a target."""
-        return self.coordinator.sense(
-            signal_types=[SignalType.SUCCESS, SignalType.PATH_CLEAR, 
-                         SignalType.OPTIMIZED],
+        return self._source(snapshot).sense(
+            signal_types=_SUCCESS_TYPES,
             target=target,
             min_strength=0.2
         )
     
-    def get_failures(self, target: str) -> List[Signal]:
+    def get_failures(self, target: str,
+                     snapshot: Optional[SwarmSnapshot] = None) -> List[Signal]:
         """Get signals about failures for a target."""
-        return self.coordinator.sense(
-            signal_types=[SignalType.FAILURE, SignalType.BLOCKED],
+        return self._source(snapshot).sense(
+            signal_types=_FAILURE_TYPES,
             target=target,
             min_strength=0.1
         )
     
-    def get_dangers(self, target: str = None) -> List[Signal]:
+    def get_dangers(self, target: str = None,
+                    snapshot: Optional[SwarmSnapshot] = None) -> List[Signal]:
         """Get danger signals, optionally filtered by target."""
-        return self.coordinator.sense(
+        return self._source(snapshot).sense(
             signal_types=[SignalType.DANGER],
             target=target,
             min_strength=0.3
         )
     
     def get_discoveries(self, limit: int = 20) -> List[Signal]:
-        """Get recent discoveries from the swarm."""
-        return self.coordinator.sense(
-            signal_types=[SignalType.LEARNED, SignalType.OPTIMIZED,
-                         SignalType.RESOURCE_FOUND],
+        """Get recent discoveries from the swarm, newest first."""
+        return self.coordinator.recent(
+            signal_types=_DISCOVERY_TYPES,
             min_strength=0.3,
             limit=limit
         )
     
-    def get_deprecations(self) -> List[Signal]:
+    def get_deprecations(self, snapshot: Optional[SwarmSnapshot] = None) -> List[Signal]:
         """Get deprecation notices."""
-        return self.coordinator.sense(
+        return self._source(snapshot).sense(
             signal_types=[SignalType.DEPRECATED],
             min_strength=0.2
         )
     
-    def get_swarm_activity(self) -> Dict[str, Any]:
+    def get_swarm_activity(self, snapshot: Optional[SwarmSnapshot] = None) -> Dict[str, Any]:
         """
         Get overview of current swarm activity.
         
         Returns summary of what other agents are doing.
         """
-        working = self.coordinator.sense(
-            signal_types=[SignalType.WORKING, SignalType.CLAIMING]
+        # Served from the per-type buckets: only claiming/working signals are visited
+        working = self._source(snapshot).sense(
+            signal_types=_ACTIVE_TYPES
         )
         
-        active_agents = {}
-        active_targets = {}
+        active_agents = defaultdict(list)
+        active_targets = defaultdict(list)
         
         for sig in working:
-            if sig.source_agent not in active_agents:
-                active_agents[sig.source_agent] = []
             active_agents[sig.source_agent].append(sig.target)
-            
-            if sig.target not in active_targets:
-                active_targets[sig.target] = []
             active_targets[sig.target].append(sig.source_agent)
         
         return {
             "active_agent_count": len(active_agents),
             "active_target_count": len(active_targets),
-            "agents": active_agents,
-            "targets": active_targets
+            "agents": dict(active_agents),
+            "targets": dict(active_targets)
         }
 
 
@@ -361,6 +418,8 @@ def create_swarm_interface(swarm_dir: Path, agent_name: str) -> Tuple[SignalEmit
     """
     Factory function to create emitter/sensor pair for an agent.
     
+    All pairs for the same swarm_dir in a process share one coordinator.
+    
     Usage:
         emitter, sensor = create_swarm_interface(swarm_dir, "my_agent")
         
@@ -371,7 +430,7 @@ def create_swarm_interface(swarm_dir: Path, agent_name: str) -> Tuple[SignalEmit
         if sensor.should_proceed("pkg.update")["proceed"]:
             ...
     """
-    coordinator = SwarmCoordinator(swarm_dir)
+    coordinator = get_coordinator(swarm_dir)
     emitter = SignalEmitter(coordinator, agent_name)
     sensor = SignalSensor(coordinator, agent_name)
     return emitter, sensor
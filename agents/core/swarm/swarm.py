@@ -11,18 +11,33 @@ Inspired by ant colony optimization and bee swarm behavior:
 - Complex emergent behavior from simple local rules
 """
 
+import atexit
+import copy
+import hashlib
+import heapq
 import json
+import operator
 import os
+import sys
 import time
 import uuid
-from dataclasses import dataclass, field, asdict
+import weakref
+from collections import defaultdict
+from dataclasses import dataclass, field, asdict, replace
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from threading import Lock
-from typing import Any, Dict, List, Optional, Set
+from threading import Event, Lock, Thread
+from typing import Any, Dict, List, Optional, Set, Tuple
 import fcntl
 
+# Try to import orjson (faster signal and index serialization)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 class SignalType(Enum):
     """Types of swarm signals (pheromones)."""
@@ -54,6 +69,28 @@ class SignalType(Enum):
     SHUTDOWN = "shutdown"         # Daemon stopping
 
 
+# One bit per signal type, so a type filter is a single AND.
+# (Member values stay strings: they are the on-disk format.)
+_TYPE_BITS: Dict[SignalType, int] = {t: 1 << i for i, t in enumerate(SignalType)}
+
+
+def _type_mask(signal_types) -> int:
+    """Bitmask of the given signal types (0 for None/empty = no filter)."""
+    mask = 0
+    for signal_type in signal_types or ():
+        mask |= _TYPE_BITS[signal_type]
+    return mask
+
+
+# Signal types that count for / against a target in get_consensus
+_POSITIVE_TYPES = frozenset({SignalType.SUCCESS, SignalType.RESOURCE_FOUND,
+                             SignalType.PATH_CLEAR, SignalType.OPTIMIZED})
+_NEGATIVE_TYPES = frozenset({SignalType.FAILURE, SignalType.BLOCKED,
+                             SignalType.DANGER, SignalType.DEPRECATED})
+POSITIVE_MASK = _type_mask(_POSITIVE_TYPES)
+NEGATIVE_MASK = _type_mask(_NEGATIVE_TYPES)
+
+
 @dataclass
 class Signal:
     """A pheromone-like signal in the swarm space."""
@@ -69,18 +106,20 @@ class Signal:
     ttl: int = 3600                # Time to live in seconds (default 1 hour)
     reinforcement_count: int = 0   # How many times this signal was reinforced
     
-    def is_expired(self) -> bool:
-        """Check if signal has expired."""
-        return time.time() > (self.created_at + self.ttl)
+    def is_expired(self, now: Optional[float] = None) -> bool:
+        """Check if signal has expired (as of ``now``, default the current time)."""
+        if now is None:
+            now = time.time()
+        return now > (self.created_at + self.ttl)
     
     def is_weak(self, threshold: float = 0.1) -> bool:
         """Check if signal strength is below threshold."""
         return self.strength < threshold
     
-    def decay(self, rate: float = 0.1) -> float:
+    def decay(self, rate: float = 0.1, now: Optional[float] = None) -> float:
         """Apply decay to signal strength. Returns new strength."""
         self.strength = max(0.0, self.strength - rate)
-        self.updated_at = time.time()
+        self.updated_at = time.time() if now is None else now
         return self.strength
     
     def reinforce(self, amount: float = 0.3) -> float:
@@ -113,41 +152,298 @@ class Signal:
         return cls(
             id=data["id"],
             signal_type=SignalType(data["signal_type"]),
-            source_agent=data["source_agent"],
-            target=data["target"],
+            # Interned: a swarm has few agents/targets and many signals
+            source_agent=sys.intern(data["source_agent"]),
+            target=sys.intern(data["target"]),
             strength=data.get("strength", 1.0),
             data=data.get("data", {}),
-            created_at=data.get("created_at", time.time()),
-            updated_at=data.get("updated_at", time.time()),
+            created_at=data["created_at"] if "created_at" in data else time.time(),
+            updated_at=data["updated_at"] if "updated_at" in data else time.time(),
             ttl=data.get("ttl", 3600),
             reinforcement_count=data.get("reinforcement_count", 0)
         )
 
 
+# Size of the recent-signals ring; a power of two so slots are picked by masking
+RECENT_RING_SIZE = 1024
+_RECENT_MASK = RECENT_RING_SIZE - 1
+
+# index.log size past which the next flush compacts it into index.json
+LOG_COMPACT_BYTES = 256 * 1024
+
+
+_strength = operator.attrgetter("strength")
+
+
+def _copy(signal: Signal) -> Signal:
+    """Detached copy of a live signal, safe to hand out to callers."""
+    return replace(signal, data=copy.deepcopy(signal.data))
+
+
+def _select_signals(candidates, signal_types: Optional[List[SignalType]],
+                    target: Optional[str], min_strength: float, limit: int,
+                    now: float) -> List[Signal]:
+    """Filter live signals and return the ``limit`` strongest (strongest first)."""
+    signals = []
+    type_mask = _type_mask(signal_types)
+    bits = _TYPE_BITS
+    for signal in candidates:
+        # Cheapest and most selective checks first
+        if target and signal.target != target:
+            continue
+        if type_mask and not bits[signal.signal_type] & type_mask:
+            continue
+        
+        # Skip expired or weak signals
+        if signal.strength < min_strength or now > signal.created_at + signal.ttl:
+            continue
+        
+        signals.append(signal)
+    
+    # Strongest first; only the top ``limit`` need ordering
+    if 0 <= limit < len(signals):
+        return heapq.nlargest(limit, signals, key=_strength)
+    signals.sort(key=_strength, reverse=True)
+    return signals[:limit]
+
+
+class SwarmSnapshot:
+    """
+    The live signals of a swarm at one instant, bucketed for repeated queries.
+    
+    Take one with SwarmCoordinator.snapshot() when several questions are
+    asked together (e.g. claim check + consensus) so they share a single
+    scan. The signals are copies owned by the snapshot; expiry is judged
+    as of ``taken_at``.
+    """
+    
+    __slots__ = ("taken_at", "signals", "_by_target", "_by_type")
+    
+    def __init__(self, signals: List[Signal], taken_at: float):
+        self.taken_at = taken_at
+        self.signals = tuple(
+            sig for sig in signals if taken_at <= sig.created_at + sig.ttl
+        )
+        self._by_target: Dict[str, List[Signal]] = defaultdict(list)
+        self._by_type: Dict[SignalType, List[Signal]] = defaultdict(list)
+        for sig in self.signals:
+            self._by_target[sig.target].append(sig)
+            self._by_type[sig.signal_type].append(sig)
+    
+    def sense(self,
+              signal_types: List[SignalType] = None,
+              target: str = None,
+              min_strength: float = 0.0,
+              limit: int = 50) -> List[Signal]:
+        """Same query as SwarmCoordinator.sense, answered from the buckets."""
+        if target:
+            candidates = self._by_target.get(target, ())
+        elif signal_types:
+            candidates = [sig for sig_type in set(signal_types)
+                          for sig in self._by_type.get(sig_type, ())]
+        else:
+            candidates = self.signals
+        return _select_signals(candidates, signal_types, target,
+                               min_strength, limit, self.taken_at)
+
+
+def _signal_id(signal_type: SignalType, source_agent: str, target: str) -> str:
+    """
+    Stable id (and file name) for a (type, agent, target) triple.
+    
+    Agent names and targets are hashed rather than embedded, so the id
+    is always a plain file name whatever characters they contain.
+    """
+    key = f"{signal_type.value}\0{source_agent}\0{target}".encode("utf-8")
+    return f"{signal_type.value}_{hashlib.sha1(key).hexdigest()[:16]}"
+
+
+def _dump_json(data: Any) -> bytes:
+    """Serialize compactly (these files are machine-read), with orjson when available."""
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    """Parse JSON bytes, with orjson when available."""
+    return orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+
+
+def _load_json_file(path: Path) -> Any:
+    """Parse a JSON file, with orjson when available."""
+    with open(path, "rb") as f:
+        return _loads(f.read())
+
+
+def _write_atomic(path: Path, payload: bytes) -> os.stat_result:
+    """
+    Write to a temporary file and rename it over ``path``.
+    
+    Readers see either the old or the new file, never a partial one.
+    Returns the stat of the written file.
+    """
+    tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            st = os.fstat(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+    return st
+
+
+def _append(path: Path, payload: bytes) -> os.stat_result:
+    """
+    Append to an existing file with a single write.
+    
+    Returns the stat of the file after the write.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND)
+    try:
+        os.write(fd, payload)
+        return os.fstat(fd)
+    finally:
+        os.close(fd)
+
+
+def _log_header(generation: str) -> bytes:
+    """First line of an index.log, naming the index.json it applies to."""
+    return b'{"op":"base","generation":' + _dump_json(generation) + b"}\n"
+
+
+# Help-request index key for requests that need no particular capability
+_ANY_CAPABILITY = "*"
+
+
+def _help_keys(signal: Signal) -> List[str]:
+    """Capabilities a help request is indexed under."""
+    needed = signal.data.get("needed_capabilities") or ()
+    if isinstance(needed, str):
+        needed = (needed,)
+    return list(needed) or [_ANY_CAPABILITY]
+
+
+def _discard(index: Dict[Any, Dict[str, None]], key: Any, signal_id: str) -> None:
+    """Remove an id from an inverted-index bucket, dropping the bucket when empty."""
+    bucket = index.get(key)
+    if bucket is not None:
+        bucket.pop(signal_id, None)
+        if not bucket:
+            del index[key]
+
+
+def _stat_key(st: os.stat_result) -> Tuple[int, int, int]:
+    """Identity of one version of a file, used to notice other writers."""
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _flush_loop(ref: "weakref.ref", wakeup: Event, interval: float) -> None:
+    """Background writer: flush a coordinator's pending changes after each wakeup."""
+    while True:
+        wakeup.wait()
+        time.sleep(interval)
+        wakeup.clear()
+        coordinator = ref()
+        if coordinator is None:
+            return
+        try:
+            coordinator.flush()
+        except OSError:
+            # Changes stay pending and are retried on the next wakeup
+            pass
+        del coordinator
+
+
+def _flush_at_exit(ref: "weakref.ref") -> None:
+    """atexit hook: write out a still-alive coordinator's pending changes."""
+    coordinator = ref()
+    if coordinator is not None:
+        coordinator.flush()
+
+
 class SwarmCoordinator:
     """
     Central coordinator for swarm-based agent communication.
     
     Uses filesystem-based stigmergy:
-    - Signals stored as JSON files in shared directory
+    - Signals stored as JSON files in shared directory, one file per
+      (type, agent, target) triple
+    - Files are replaced atomically, so readers need no lock; writers of
+      index.json serialize on index.lock
+    - index.json carries the full record of every signal, so sensing
+      reads one file instead of one per signal
+    - Changes since index.json was written are appended to index.log as
+      JSON lines ({"op": "add"|"del", ...}); the log is compacted into a
+      fresh index.json on decay or once it grows past LOG_COMPACT_BYTES
     - Agents read/write signals independently
     - Decay process runs periodically to fade old signals
     
+    Signals are held in memory and written behind: emit/decay update the
+    in-memory view and a background thread flushes the changes to disk
+    every ``flush_interval`` seconds (and at exit). Changes written by
+    other processes are picked up by replaying the lines appended to
+    index.log since the last read, or by reloading index.json after a
+    compaction.
+    Signals returned by emit/sense/recent/help_requests/snapshot are
+    copies, so changing them does not touch the swarm.
+    
     This enables emergent coordination without direct agent-to-agent communication.
     """
     
-    def __init__(self, swarm_dir: Path):
+    def __init__(self, swarm_dir: Path, flush_interval: float = 1.0):
         self.swarm_dir = Path(swarm_dir)
         self.signals_dir = self.swarm_dir / "signals"
         self.index_file = self.swarm_dir / "index.json"
+        self.log_file = self.swarm_dir / "index.log"
+        self.lock_file = self.swarm_dir / "index.lock"
         self._lock = Lock()
         
+        # In-memory view of the swarm and the changes not yet on disk
+        self._signals: Dict[str, Signal] = {}
+        self._triple_index: Dict[Tuple[SignalType, str, str], str] = {}
+        # Inverted indexes: target/type -> ids (dicts used as ordered sets)
+        self._by_target: Dict[str, Dict[str, None]] = defaultdict(dict)
+        self._by_type: Dict[SignalType, Dict[str, None]] = defaultdict(dict)
+        self._help_by_capability: Dict[str, Dict[str, None]] = defaultdict(dict)
+        self._dirty: Set[str] = set()
+        self._deleted: Set[str] = set()
+        # Serialized (record, index entry) of each signal, reused until it changes
+        self._records: Dict[str, Tuple[bytes, bytes]] = {}
+        self._compact_due = False
+        self._last_decay = 0.0
+        self._index_key: Optional[Tuple[int, int, int]] = None
+        # index.json generation and how far into its index.log we have read;
+        # _log_ino is None while no log for this generation has been seen
+        self._generation: Optional[str] = None
+        self._log_ino: Optional[int] = None
+        self._log_offset = 0
+        
+        # Write-behind flusher, started on the first change
+        self.flush_interval = flush_interval
+        self._flusher: Optional[Thread] = None
+        self._flush_wakeup = Event()
+        
+        # Most recently emitted/updated signals, newest at _recent_head - 1
+        self._recent_ring: List[Optional[Signal]] = [None] * RECENT_RING_SIZE
+        self._recent_head = 0
+        
         # Ensure directories exist
         self.signals_dir.mkdir(parents=True, exist_ok=True)
         
-        # Initialize index if needed
+        # Initialize index if needed (re-checked under the writers' lock, so
+        # processes starting on an empty directory write one generation)
         if not self.index_file.exists():
-            self._write_index({"signals": {}, "last_decay": time.time()})
+            with self._lock_index():
+                if not self.index_file.exists():
+                    self._last_decay = time.time()
+                    self._write_index()
         
         # Decay configuration
         self.decay_rate = 0.05          # 5% decay per cycle
@@ -155,25 +451,339 @@ class SwarmCoordinator:
         self.weak_threshold = 0.1       # Remove signals below this strength
     
     def _read_index(self) -> Dict[str, Any]:
-        """Read the signal index with locking."""
+        """Read the signal index (replaced atomically, so no lock is needed)."""
         try:
-            with open(self.index_file, 'r') as f:
-                fcntl.flock(f.fileno(), fcntl.LOCK_SH)
-                try:
-                    return json.load(f)
-                finally:
-                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            return _load_json_file(self.index_file)
         except (json.JSONDecodeError, FileNotFoundError):
             return {"signals": {}, "last_decay": time.time()}
     
-    def _write_index(self, data: Dict[str, Any]) -> None:
-        """Write the signal index with locking."""
-        with open(self.index_file, 'w') as f:
-            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+    def _write_index(self) -> None:
+        """Atomically replace the signal index with the in-memory view and start its log."""
+        generation = uuid.uuid4().hex
+        index_st = _write_atomic(self.index_file, self._index_payload(generation))
+        log_st = _write_atomic(self.log_file, _log_header(generation))
+        self._index_key = _stat_key(index_st)
+        self._generation = generation
+        self._log_ino = log_st.st_ino
+        self._log_offset = log_st.st_size
+    
+    def _lock_index(self):
+        """
+        Take the exclusive index writers' lock.
+        
+        Returns the open lock file; closing it releases the lock.
+        """
+        lock = open(self.lock_file, 'a')
+        fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+        return lock
+    
+    def _record(self, signal_id: str) -> Tuple[bytes, bytes]:
+        """
+        Serialized signal file payload and index entry of a signal.
+        
+        Cached until the signal changes. Caller must hold ``_lock``.
+        """
+        cached = self._records.get(signal_id)
+        if cached is None:
+            record = _dump_json(self._signals[signal_id].to_dict())
+            cached = (record, _dump_json(signal_id) + b":" + record)
+            self._records[signal_id] = cached
+        return cached
+    
+    def _index_payload(self, generation: str) -> bytes:
+        """
+        Serialize the in-memory view as an index document.
+        
+        Assembled from the cached per-signal records, so only signals
+        changed since the last write are serialized again.
+        """
+        entries = b",".join(self._record(sig_id)[1] for sig_id in self._signals)
+        return (b'{"signals":{' + entries + b'},"last_decay":'
+                + _dump_json(self._last_decay) + b',"generation":'
+                + _dump_json(generation) + b"}")
+    
+    def _merge_index(self, index: Dict[str, Any]) -> None:
+        """
+        Bring the in-memory view up to date with an index read from disk.
+        
+        Signals with unflushed local changes keep the local version.
+        Expired entries are not loaded; they are queued for removal with
+        the next flush. Caller must hold ``_lock``.
+        """
+        entries = index.get("signals", {})
+        signals = self._signals
+        dirty = self._dirty
+        deleted = self._deleted
+        merged: Dict[str, Signal] = {}
+        now = time.time()
+        
+        # Keep the on-disk order; locally added signals go last
+        for sig_id, entry in entries.items():
+            if sig_id in deleted:
+                continue
+            current = signals.get(sig_id)
+            if current is None or (sig_id not in dirty and
+                                   current.updated_at != entry.get("updated_at")):
+                # Judge expiry from the entry itself (legacy entries lack ttl)
+                if "ttl" in entry and now > entry["created_at"] + entry["ttl"]:
+                    deleted.add(sig_id)
+                    continue
+                current = self._signal_from_index(sig_id, entry)
+                self._records.pop(sig_id, None)
+                if current:
+                    self._push_recent(current)
+            if current:
+                merged[sig_id] = current
+        for sig_id in dirty:
+            if sig_id not in merged and sig_id in signals:
+                merged[sig_id] = signals[sig_id]
+        
+        self._signals = merged
+        if len(self._records) > len(merged):
+            self._records = {k: v for k, v in self._records.items() if k in merged}
+        self._rebuild_indexes()
+        self._last_decay = max(self._last_decay, index.get("last_decay", 0))
+    
+    def _rebuild_indexes(self) -> None:
+        """Recompute the lookup indexes from ``_signals``. Caller must hold ``_lock``."""
+        self._triple_index = {}
+        self._by_target = defaultdict(dict)
+        self._by_type = defaultdict(dict)
+        self._help_by_capability = defaultdict(dict)
+        for signal in self._signals.values():
+            self._index_signal(signal)
+    
+    def _index_signal(self, signal: Signal) -> None:
+        """Add a signal to the lookup indexes. Caller must hold ``_lock``."""
+        self._triple_index.setdefault(
+            (signal.signal_type, signal.source_agent, signal.target), signal.id
+        )
+        self._by_target[signal.target][signal.id] = None
+        self._by_type[signal.signal_type][signal.id] = None
+        if signal.signal_type is SignalType.HELP_NEEDED:
+            for capability in _help_keys(signal):
+                self._help_by_capability[capability][signal.id] = None
+    
+    def _unindex_signal(self, signal: Signal) -> None:
+        """Remove a signal from the lookup indexes. Caller must hold ``_lock``."""
+        triple = (signal.signal_type, signal.source_agent, signal.target)
+        if self._triple_index.get(triple) == signal.id:
+            del self._triple_index[triple]
+        _discard(self._by_target, signal.target, signal.id)
+        _discard(self._by_type, signal.signal_type, signal.id)
+        if signal.signal_type is SignalType.HELP_NEEDED:
+            for capability in _help_keys(signal):
+                _discard(self._help_by_capability, capability, signal.id)
+    
+    def _sync(self) -> None:
+        """
+        Pick up changes written by other processes. Caller must hold ``_lock``.
+        
+        index.json is reloaded only when it was replaced (a compaction);
+        otherwise just the new lines of index.log are replayed.
+        """
+        try:
+            key = _stat_key(os.stat(self.index_file))
+        except FileNotFoundError:
+            return
+        if key != self._index_key:
+            index = self._read_index()
+            self._merge_index(index)
+            self._index_key = key
+            self._generation = index.get("generation")
+            self._log_ino = None
+            self._log_offset = 0
+        self._replay_log()
+    
+    def _replay_log(self) -> None:
+        """Apply the index.log lines not read yet. Caller must hold ``_lock``."""
+        try:
+            st = os.stat(self.log_file)
+        except FileNotFoundError:
+            return
+        if st.st_ino == self._log_ino and st.st_size == self._log_offset:
+            return
+        
+        try:
+            f = open(self.log_file, "rb")
+        except FileNotFoundError:
+            return
+        with f:
+            st = os.fstat(f.fileno())
+            if st.st_ino != self._log_ino or st.st_size < self._log_offset:
+                # A new log: only follow it if it belongs to our index.json
+                # (it may be a compaction whose index.json we have not read)
+                header = f.readline()
+                try:
+                    generation = _loads(header).get("generation")
+                except ValueError:
+                    return
+                if generation is None or generation != self._generation:
+                    return
+                self._log_ino = st.st_ino
+                self._log_offset = f.tell()
+            else:
+                f.seek(self._log_offset)
+            data = f.read()
+        
+        # Stop at the last complete line; a partial one is read next time
+        end = data.rfind(b"\n") + 1
+        now = time.time()
+        for line in data[:end].splitlines():
+            try:
+                entry = _loads(line)
+            except ValueError:
+                continue
+            self._apply_log_entry(entry, now)
+        self._log_offset += end
+    
+    def _apply_log_entry(self, entry: Dict[str, Any], now: float) -> None:
+        """
+        Apply one index.log operation to the in-memory view.
+        
+        Signals with unflushed local changes keep the local version, and
+        expired records are queued for removal instead of loaded, as in
+        _merge_index(). Caller must hold ``_lock``.
+        """
+        sig_id = entry.get("id")
+        if sig_id in self._dirty or sig_id in self._deleted:
+            return
+        current = self._signals.get(sig_id)
+        meta = entry.get("meta") if entry.get("op") == "add" else None
+        
+        if meta is not None and not now > meta["created_at"] + meta["ttl"]:
+            if current is not None and current.updated_at == meta.get("updated_at"):
+                return
+            signal = Signal.from_dict(meta)
+            # Replacing in place keeps the signal's position in the view
+            self._signals[sig_id] = signal
+            if current is None or current.signal_type is SignalType.HELP_NEEDED:
+                if current is not None:
+                    self._unindex_signal(current)
+                self._index_signal(signal)
+            self._records.pop(sig_id, None)
+            self._push_recent(signal)
+            return
+        
+        if current is not None:
+            del self._signals[sig_id]
+            self._unindex_signal(current)
+            self._records.pop(sig_id, None)
+        if meta is not None:
+            self._deleted.add(sig_id)
+    
+    def _push_recent(self, signal: Signal) -> None:
+        """Record a signal in the recent ring. Caller must hold ``_lock``."""
+        self._recent_ring[self._recent_head & _RECENT_MASK] = signal
+        self._recent_head += 1
+    
+    def _mark_dirty(self, signal_id: str) -> None:
+        """Record a changed signal and wake the flusher. Caller must hold ``_lock``."""
+        self._dirty.add(signal_id)
+        self._deleted.discard(signal_id)
+        self._records.pop(signal_id, None)
+        self._schedule_flush()
+    
+    def _mark_deleted(self, signal_id: str) -> None:
+        """Record a removed signal and wake the flusher. Caller must hold ``_lock``."""
+        self._deleted.add(signal_id)
+        self._dirty.discard(signal_id)
+        self._records.pop(signal_id, None)
+        self._schedule_flush()
+    
+    def _schedule_flush(self) -> None:
+        """Wake the background flusher, starting it on first use."""
+        self._flush_wakeup.set()
+        if self._flusher is None:
+            ref = weakref.ref(self)
+            self._flusher = Thread(
+                target=_flush_loop,
+                args=(ref, self._flush_wakeup, self.flush_interval),
+                name="swarm-flusher",
+                daemon=True
+            )
+            self._flusher.start()
+            atexit.register(_flush_at_exit, ref)
+    
+    def flush(self) -> None:
+        """
+        Write pending changes to disk: signal files and index.log.
+        
+        Changes are appended to index.log as one line per signal. When a
+        compaction is due (after decay, once the log is large, or when
+        there is no log for the current index.json) a fresh index.json
+        and an empty log are written instead.
+        
+        The index is synced under the writers' lock first so that signals
+        written meanwhile by other processes are kept. The pending changes
+        are serialized under ``_lock`` but written to disk outside it, so
+        emit/sense do not wait on file I/O.
+        """
+        with self._lock:
+            if not (self._dirty or self._deleted or self._compact_due):
+                return
+        
+        with self._lock_index():
+            with self._lock:
+                self._sync()
+                dirty, self._dirty = self._dirty, set()
+                deleted, self._deleted = self._deleted, set()
+                compact = (self._compact_due or self._log_ino is None
+                           or self._log_offset >= LOG_COMPACT_BYTES)
+                self._compact_due = False
+                # In view order, so that readers replaying the log add new
+                # signals in the order they were emitted
+                payloads = [
+                    (sig_id, self._record(sig_id)[0])
+                    for sig_id in self._signals if sig_id in dirty
+                ]
+                if compact:
+                    generation = uuid.uuid4().hex
+                    index_payload = self._index_payload(generation)
+                    log_payload = _log_header(generation)
+                else:
+                    log_payload = b"".join(
+                        [b'{"op":"del","id":' + _dump_json(sig_id) + b"}\n"
+                         for sig_id in deleted] +
+                        [b'{"op":"add","id":' + _dump_json(sig_id) + b',"meta":'
+                         + payload + b"}\n" for sig_id, payload in payloads]
+                    )
+            
+            failed = []
             try:
-                json.dump(data, f, indent=2)
-            finally:
-                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+                for sig_id in deleted:
+                    self._delete_signal(sig_id)
+                for sig_id, payload in payloads:
+                    try:
+                        _write_atomic(self.signals_dir / f"{sig_id}.json", payload)
+                    except OSError:
+                        # One unwritable file must not hold up the rest of
+                        # the batch; index.json/index.log carry the record
+                        failed.append(sig_id)
+                if compact:
+                    # index.json first: readers ignore a log whose
+                    # generation does not match the index they have
+                    index_key = _stat_key(_write_atomic(self.index_file, index_payload))
+                    log_st = _write_atomic(self.log_file, log_payload)
+                else:
+                    log_st = _append(self.log_file, log_payload)
+            except BaseException:
+                # Keep the changes pending for the next flush
+                with self._lock:
+                    self._dirty.update(i for i in dirty if i not in self._deleted)
+                    self._deleted.update(i for i in deleted if i not in self._dirty)
+                    self._compact_due = True
+                raise
+            
+            with self._lock:
+                if compact:
+                    self._index_key = index_key
+                    self._generation = generation
+                self._log_ino = log_st.st_ino
+                self._log_offset = log_st.st_size
+                # Signal files that could not be written are retried next flush
+                self._dirty.update(i for i in failed
+                                   if i in self._signals and i not in self._deleted)
     
     def emit(self, 
              signal_type: SignalType, 
@@ -188,67 +798,86 @@ class SwarmCoordinator:
         If a similar signal exists (same type, agent, target), reinforce it instead.
         """
         with self._lock:
-            index = self._read_index()
-            
-            # Check for existing similar signal to reinforce
-            existing_id = None
-            for sig_id, sig_meta in index["signals"].items():
-                if (sig_meta["signal_type"] == signal_type.value and
-                    sig_meta["source_agent"] == source_agent and
-                    sig_meta["target"] == target):
-                    existing_id = sig_id
-                    break
-            
-            if existing_id:
-                # Reinforce existing signal
-                signal = self._load_signal(existing_id)
-                if signal:
-                    signal.reinforce()
-                    if data:
-                        signal.data.update(data)
-                    self._save_signal(signal)
-                    return signal
-            
-            # Create new signal
-            signal = Signal(
-                id=str(uuid.uuid4())[:8],
-                signal_type=signal_type,
-                source_agent=source_agent,
-                target=target,
-                strength=strength,
-                data=data or {},
-                ttl=ttl
-            )
-            
-            # Save signal file
-            self._save_signal(signal)
-            
-            # Update index
-            index["signals"][signal.id] = {
-                "signal_type": signal_type.value,
-                "source_agent": source_agent,
-                "target": target,
-                "created_at": signal.created_at
-            }
-            self._write_index(index)
-            
-            return signal
+            self._sync()
+            return _copy(self._emit_locked(signal_type, source_agent, target,
+                                           data, strength, ttl))
     
-    def _save_signal(self, signal: Signal) -> None:
-        """Save signal to file."""
-        signal_file = self.signals_dir / f"{signal.id}.json"
-        with open(signal_file, 'w') as f:
-            json.dump(signal.to_dict(), f, indent=2)
+    def emit_many(self, signals: List[Dict[str, Any]]) -> List[Signal]:
+        """
+        Emit several signals under one lock acquisition and index check.
+        
+        Each item holds the keyword arguments of emit(). Returns the
+        emitted (or reinforced) signals in order.
+        """
+        with self._lock:
+            self._sync()
+            return [_copy(self._emit_locked(**spec)) for spec in signals]
+    
+    def _emit_locked(self,
+                     signal_type: SignalType,
+                     source_agent: str,
+                     target: str,
+                     data: Dict[str, Any] = None,
+                     strength: float = 1.0,
+                     ttl: int = 3600) -> Signal:
+        """Body of emit(). Caller must hold ``_lock``."""
+        source_agent = sys.intern(source_agent)
+        target = sys.intern(target)
+        
+        # Check for existing similar signal to reinforce
+        triple = (signal_type, source_agent, target)
+        existing_id = self._triple_index.get(triple)
+        existing = self._signals.get(existing_id) if existing_id else None
+        
+        if existing:
+            # Reinforce existing signal
+            existing.reinforce()
+            if data:
+                if existing.signal_type is SignalType.HELP_NEEDED:
+                    # New data may change the capabilities it is indexed under
+                    self._unindex_signal(existing)
+                    existing.data.update(data)
+                    self._index_signal(existing)
+                else:
+                    existing.data.update(data)
+            self._mark_dirty(existing.id)
+            self._push_recent(existing)
+            return existing
+        
+        # Create new signal
+        signal = Signal(
+            id=_signal_id(signal_type, source_agent, target),
+            signal_type=signal_type,
+            source_agent=source_agent,
+            target=target,
+            strength=strength,
+            data=data or {},
+            ttl=ttl
+        )
+        
+        self._signals[signal.id] = signal
+        self._index_signal(signal)
+        self._push_recent(signal)
+        self._mark_dirty(signal.id)
+        
+        return signal
     
     def _load_signal(self, signal_id: str) -> Optional[Signal]:
         """Load signal from file."""
         signal_file = self.signals_dir / f"{signal_id}.json"
         try:
-            with open(signal_file, 'r') as f:
-                return Signal.from_dict(json.load(f))
+            return Signal.from_dict(_load_json_file(signal_file))
         except (json.JSONDecodeError, FileNotFoundError):
             return None
     
+    def _signal_from_index(self, signal_id: str,
+                           entry: Dict[str, Any]) -> Optional[Signal]:
+        """Build a signal from its index entry, reading the file only for legacy entries."""
+        if "strength" in entry:
+            return Signal.from_dict(entry)
+        # Indexes written before full records were kept only hold metadata
+        return self._load_signal(signal_id)
+    
     def _delete_signal(self, signal_id: str) -> None:
         """Delete signal file."""
         signal_file = self.signals_dir / f"{signal_id}.json"
@@ -274,30 +903,86 @@ class SwarmCoordinator:
         Returns:
             List of signals, sorted by strength (strongest first)
         """
-        signals = []
-        index = self._read_index()
-        
-        for sig_id in list(index["signals"].keys()):
-            signal = self._load_signal(sig_id)
-            if not signal:
-                continue
-            
-            # Skip expired or weak signals
-            if signal.is_expired() or signal.strength < min_strength:
-                continue
-            
-            # Apply filters
-            if signal_types and signal.signal_type not in signal_types:
-                continue
-            if target and signal.target != target:
-                continue
-            
-            signals.append(signal)
+        now = time.time()
+        with self._lock:
+            self._sync()
+            signals = self._signals
+            # Narrow to the target's (or the types') bucket when filtering
+            if target:
+                ids = self._by_target.get(target, ())
+            elif signal_types:
+                ids = [sig_id for sig_type in set(signal_types)
+                       for sig_id in self._by_type.get(sig_type, ())]
+            else:
+                ids = None
+            candidates = (list(signals.values()) if ids is None
+                          else [signals[sig_id] for sig_id in ids])
+            # Copied under the lock: decay/reinforce update signals in place
+            return [_copy(sig) for sig in _select_signals(
+                candidates, signal_types, target, min_strength, limit, now)]
+    
+    def snapshot(self) -> SwarmSnapshot:
+        """Capture the live signals once for a batch of queries."""
+        now = time.time()
+        with self._lock:
+            self._sync()
+            candidates = [_copy(sig) for sig in self._signals.values()
+                          if now <= sig.created_at + sig.ttl]
+        return SwarmSnapshot(candidates, now)
+    
+    def recent(self,
+               signal_types: List[SignalType] = None,
+               min_strength: float = 0.0,
+               limit: int = 20) -> List[Signal]:
+        """
+        Most recently emitted or updated live signals, newest first.
         
-        # Sort by strength (strongest first)
-        signals.sort(key=lambda s: s.strength, reverse=True)
+        Walks the recent ring backwards for at most RECENT_RING_SIZE
+        slots, so only the latest updates are considered.
+        """
+        result = []
+        seen = set()
+        ring = self._recent_ring
+        type_mask = _type_mask(signal_types)
+        now = time.time()
+        with self._lock:
+            self._sync()
+            live = self._signals
+            head = self._recent_head
+            for pos in range(head - 1, max(head - RECENT_RING_SIZE, 0) - 1, -1):
+                signal = ring[pos & _RECENT_MASK]
+                # Skip superseded slots and repeats of a reinforced signal
+                if live.get(signal.id) is not signal or signal.id in seen:
+                    continue
+                seen.add(signal.id)
+                if now > signal.created_at + signal.ttl or signal.strength < min_strength:
+                    continue
+                if type_mask and not _TYPE_BITS[signal.signal_type] & type_mask:
+                    continue
+                result.append(_copy(signal))
+                if len(result) >= limit:
+                    break
+        return result
+    
+    def help_requests(self,
+                      capabilities: List[str],
+                      min_strength: float = 0.2,
+                      limit: int = 50) -> List[Signal]:
+        """
+        Live help requests that need any of ``capabilities`` or none in particular.
         
-        return signals[:limit]
+        Answered from the capability index, strongest first.
+        """
+        now = time.time()
+        with self._lock:
+            self._sync()
+            index = self._help_by_capability
+            ids: Dict[str, None] = {}
+            for capability in (*capabilities, _ANY_CAPABILITY):
+                ids.update(index.get(capability, {}))
+            candidates = [self._signals[sig_id] for sig_id in ids]
+            return [_copy(sig) for sig in _select_signals(
+                candidates, [SignalType.HELP_NEEDED], None, min_strength, limit, now)]
     
     def sense_for_target(self, target: str) -> Dict[str, List[Signal]]:
         """
@@ -314,7 +999,8 @@ class SwarmCoordinator:
             grouped[type_name].append(signal)
         return grouped
     
-    def get_consensus(self, target: str) -> Dict[str, Any]:
+    def get_consensus(self, target: str,
+                      snapshot: Optional[SwarmSnapshot] = None) -> Dict[str, Any]:
         """
         Get swarm consensus about a target.
         
@@ -322,26 +1008,22 @@ class SwarmCoordinator:
         - Overall sentiment (positive/negative/neutral)
         - Confidence level (based on signal count and strength)
         - Recommended action
-        """
-        signals = self.sense_for_target(target)
         
-        positive_types = {SignalType.SUCCESS, SignalType.RESOURCE_FOUND, 
-                        SignalType.PATH_CLEAR, SignalType.OPTIMIZED}
-        negative_types = {SignalType.FAILURE, SignalType.BLOCKED, 
-                         SignalType.DANGER, SignalType.DEPRECATED}
+        Pass ``snapshot`` to answer from an already captured view.
+        """
+        signals = (snapshot or self).sense(target=target)
         
         positive_score = 0.0
         negative_score = 0.0
         total_signals = 0
         
-        for type_name, sigs in signals.items():
-            sig_type = SignalType(type_name)
-            for sig in sigs:
-                total_signals += 1
-                if sig_type in positive_types:
-                    positive_score += sig.strength
-                elif sig_type in negative_types:
-                    negative_score += sig.strength
+        for sig in signals:
+            total_signals += 1
+            bit = _TYPE_BITS[sig.signal_type]
+            if bit & POSITIVE_MASK:
+                positive_score += sig.strength
+            elif bit & NEGATIVE_MASK:
+                negative_score += sig.strength
         
         if total_signals == 0:
             return {
@@ -377,42 +1059,46 @@ class SwarmCoordinator:
         """
         Apply decay to all signals. Remove expired/weak signals.
         
+        Works one signal type at a time, releasing the lock in between so
+        emits are not held up for the whole pass.
+        
         Returns statistics about the decay operation.
         """
+        decayed = 0
+        removed = 0
+        now = time.time()
+        
         with self._lock:
-            index = self._read_index()
-            
-            decayed = 0
-            removed = 0
-            
-            for sig_id in list(index["signals"].keys()):
-                signal = self._load_signal(sig_id)
-                if not signal:
-                    # Signal file missing, clean up index
-                    del index["signals"][sig_id]
-                    removed += 1
-                    continue
-                
-                if signal.is_expired() or signal.is_weak(self.weak_threshold):
-                    # Remove expired/weak signal
-                    self._delete_signal(sig_id)
-                    del index["signals"][sig_id]
-                    removed += 1
-                else:
-                    # Apply decay
-                    signal.decay(self.decay_rate)
-                    self._save_signal(signal)
-                    decayed += 1
-            
-            index["last_decay"] = time.time()
-            self._write_index(index)
-            
-            return {"decayed": decayed, "removed": removed}
+            self._sync()
+        
+        for signal_type in SignalType:
+            with self._lock:
+                for sig_id in list(self._by_type.get(signal_type, ())):
+                    signal = self._signals[sig_id]
+                    if signal.is_expired(now) or signal.is_weak(self.weak_threshold):
+                        # Remove expired/weak signal
+                        del self._signals[sig_id]
+                        self._unindex_signal(signal)
+                        self._mark_deleted(sig_id)
+                        removed += 1
+                    else:
+                        # Apply decay
+                        signal.decay(self.decay_rate, now)
+                        self._mark_dirty(sig_id)
+                        decayed += 1
+        
+        with self._lock:
+            self._last_decay = now
+            self._compact_due = True
+            self._schedule_flush()
+        
+        return {"decayed": decayed, "removed": removed}
     
     def maybe_decay(self) -> Optional[Dict[str, int]]:
         """Run decay if enough time has passed since last decay."""
-        index = self._read_index()
-        last_decay = index.get("last_decay", 0)
+        with self._lock:
+            self._sync()
+            last_decay = self._last_decay
         
         if time.time() - last_decay > self.decay_interval:
             return self.decay_all()
@@ -420,8 +1106,8 @@ class SwarmCoordinator:
     
     def get_stats(self) -> Dict[str, Any]:
         """Get swarm statistics."""
-        index = self._read_index()
         signals = self.sense(limit=1000)
+        last_decay = self._last_decay
         
         type_counts = {}
         agent_counts = {}
@@ -439,13 +1125,53 @@ class SwarmCoordinator:
             "signals_by_agent": agent_counts,
             "average_strength": total_strength / max(1, len(signals)),
             "last_decay": datetime.fromtimestamp(
-                index.get("last_decay", 0)
-            ).isoformat() if index.get("last_decay") else None
+                last_decay
+            ).isoformat() if last_decay else None
         }
     
     def clear(self) -> None:
         """Clear all signals (for testing/reset)."""
-        with self._lock:
-            for signal_file in self.signals_dir.glob("*.json"):
-                signal_file.unlink()
-            self._write_index({"signals": {}, "last_decay": time.time()})
+        # Same lock order as flush(): the writers' lock, then _lock
+        with self._lock_index(), self._lock:
+            with os.scandir(self.signals_dir) as it:
+                for entry in it:
+                    # Same files as glob("*.json"), without a stat per entry
+                    if entry.name.endswith(".json") and not entry.name.startswith("."):
+                        try:
+                            os.unlink(entry.path)
+                        except FileNotFoundError:
+                            pass
+            self._signals.clear()
+            self._records.clear()
+            self._rebuild_indexes()
+            self._dirty.clear()
+            self._deleted.clear()
+            self._compact_due = False
+            self._last_decay = time.time()
+            self._write_index()
+
+
+# One coordinator per swarm directory in this process; misses are serialized
+_coordinators: Dict[str, SwarmCoordinator] = {}
+_coordinators_lock = Lock()
+
+
+def get_coordinator(swarm_dir: Path) -> SwarmCoordinator:
+    """
+    Get or create the shared coordinator for ``swarm_dir``.
+    
+    Agents in one process that sense and emit through the same
+    coordinator see each other's signals in memory at once, without
+    waiting for a flush and re-read from disk.
+    """
+    key = os.path.abspath(swarm_dir)
+    try:
+        return _coordinators[key]
+    except KeyError:
+        pass
+    
+    with _coordinators_lock:
+        coordinator = _coordinators.get(key)
+        if coordinator is None:
+            coordinator = _coordinators[key] = SwarmCoordinator(swarm_dir)
+        return coordinator
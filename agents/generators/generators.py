@@ -6,18 +6,70 @@ Template generators for skills, agents, and tasks.
 Produces production-ready code following the Unified Agent Framework.
 """
 
-import os
-import json
+import functools
+import py_compile
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+# Threads used by generate_many() to write files
+WRITE_WORKERS = 8
+
+
+def _write(path: Path, content: str) -> None:
+    """Write generated text as UTF-8 with a single buffered write."""
+    with open(path, 'wb', buffering=1 << 16) as f:
+        f.write(content.encode('utf-8'))
+
+
+def _precompile(path: Path) -> None:
+    """Byte-compile a generated module into __pycache__ so its first import skips parsing."""
+    if sys.dont_write_bytecode:
+        return
+    try:
+        py_compile.compile(str(path), doraise=True)
+    except (py_compile.PyCompileError, OSError):
+        # The import reports syntax errors itself; a missing cache only costs a parse
+        pass
+
+
+def _py_list_literal(items: List[str]) -> str:
+    """Python list literal of strings, double-quoted like the hand-written skills."""
+    if any('"' in item or '\\' in item or not item.isprintable() for item in items):
+        # Needs escaping: let repr() produce a valid literal
+        return repr(items)
+    return '[' + ', '.join([f'"{item}"' for item in items]) + ']'
+
 
-# Try to import YAML
-try:
-    import yaml
-    HAS_YAML = True
-except ImportError:
-    HAS_YAML = False
+@functools.lru_cache(maxsize=1024)
+def _class_name(name: str) -> str:
+    """PascalCase class name prefix for a snake_case skill name."""
+    return ''.join([word.capitalize() for word in name.split('_')])
+
+
+@functools.lru_cache(maxsize=256)
+def _underline(name: str) -> str:
+    """Docstring title underline for "<name> Skill"."""
+    return '=' * (len(name) + 6)
+
+
+def _write_all(files: List[Tuple[Path, str]]) -> None:
+    """
+    Write several generated files, overlapping their I/O on a thread pool.
+    
+    A path listed more than once gets its last content, as with
+    sequential writes, and is written only once.
+    """
+    files = list(dict(files).items())
+    if len(files) > 1:
+        with ThreadPoolExecutor(max_workers=min(WRITE_WORKERS, len(files))) as pool:
+            # list() re-raises the first write error
+            list(pool.map(lambda item: _write(*item), files))
+    else:
+        for path, content in files:
+            _write(path, content)
 
 
 class SkillGenerator:
@@ -128,12 +180,59 @@ class {class_name}Skill(Skill):
         Returns:
             Dict with paths to created files
         """
+        (self.skills_dir / name).mkdir(parents=True, exist_ok=True)
+        files, result = self._render(name, description, functions, capabilities)
+        for path, content in files:
+            _write(path, content)
+        _precompile(Path(result["files"]["implementation"]))
+        return result
+    
+    def generate_many(self, specs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Generate several skills, writing their files concurrently.
+        
+        Each spec holds the keyword arguments of generate(). Templates are
+        rendered up front; only the file writes go to the thread pool.
+        The skill modules are byte-compiled once all files are written.
+        Returns the generate() results in spec order.
+        """
+        rendered = [self._render(**spec) for spec in specs]
+        for name in dict.fromkeys(spec["name"] for spec in specs):
+            (self.skills_dir / name).mkdir(parents=True, exist_ok=True)
+        _write_all([item for files, _ in rendered for item in files])
+        for implementation in dict.fromkeys(r["files"]["implementation"] for _, r in rendered):
+            _precompile(Path(implementation))
+        return [result for _, result in rendered]
+    
+    def _render(
+        self,
+        name: str,
+        description: str,
+        functions: List[Dict[str, str]],
+        capabilities: List[str]
+    ) -> Tuple[List[Tuple[Path, str]], Dict[str, Any]]:
+        """Render a skill's files; returns (path, content) pairs and the result dict."""
         skill_dir = self.skills_dir / name
-        skill_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Build every per-function fragment in one pass over functions
+        capability = capabilities[0] if capabilities else "filesystem.read"
+        provides_list = []
+        function_map_lines = []
+        implementations = []
+        for f in functions:
+            func_name = f["name"]
+            provides_list.append(func_name)
+            function_map_lines.append(f'            "{func_name}": self.{func_name},')
+            implementations.append(self.FUNCTION_TEMPLATE.format(
+                name=func_name,
+                description=f.get("description", func_name),
+                params=f.get("params", ""),
+                capability=capability
+            ))
         
         # Generate skill.yml
-        provides_str = '\n'.join(f'  - {f["name"]}' for f in functions)
-        caps_str = '\n'.join(f'  - {c}' for c in capabilities)
+        provides_str = '\n'.join([f'  - {n}' for n in provides_list])
+        caps_str = '\n'.join([f'  - {c}' for c in capabilities])
         
         yml_content = self.SKILL_YML_TEMPLATE.format(
             name=name,
@@ -143,44 +242,27 @@ class {class_name}Skill(Skill):
         )
         
         yml_path = skill_dir / "skill.yml"
-        yml_path.write_text(yml_content)
         
         # Generate skill.py
-        class_name = ''.join(word.capitalize() for word in name.split('_'))
-        underline = '=' * (len(name) + 6)
-        
-        provides_list = [f["name"] for f in functions]
-        
-        function_map = '\n'.join(
-            f'            "{f["name"]}": self.{f["name"]},'
-            for f in functions
-        )
-        
-        function_implementations = '\n'.join(
-            self.FUNCTION_TEMPLATE.format(
-                name=f["name"],
-                description=f.get("description", f["name"]),
-                params=f.get("params", ""),
-                capability=capabilities[0] if capabilities else "filesystem.read"
-            )
-            for f in functions
-        )
+        class_name = _class_name(name)
+        underline = _underline(name)
+        function_map = '\n'.join(function_map_lines)
+        function_implementations = '\n'.join(implementations)
         
         py_content = self.SKILL_PY_TEMPLATE.format(
             name=name,
             underline=underline,
             description=description,
             class_name=class_name,
-            provides_list=repr(provides_list),
-            capabilities_list=repr(capabilities),
+            provides_list=_py_list_literal(provides_list),
+            capabilities_list=_py_list_literal(capabilities),
             function_map=function_map,
             function_implementations=function_implementations
         )
         
         py_path = skill_dir / "skill.py"
-        py_path.write_text(py_content)
         
-        return {
+        return [(yml_path, yml_content), (py_path, py_content)], {
             "status": "success",
             "skill_name": name,
             "files": {
@@ -239,13 +321,39 @@ tasks:
             Dict with path to created file
         """
         self.models_dir.mkdir(parents=True, exist_ok=True)
+        yml_path, yml_content, result = self._render(
+            name, description, capabilities, skills, tasks
+        )
+        _write(yml_path, yml_content)
+        return result
+    
+    def generate_many(self, specs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Generate several agent definitions, writing them concurrently.
         
-        caps_str = '\n'.join(f'  - {c}' for c in capabilities)
-        skills_str = '\n'.join(f'  - {s}' for s in skills)
-        tasks_str = '\n'.join(
+        Each spec holds the keyword arguments of generate(). Returns the
+        generate() results in spec order.
+        """
+        self.models_dir.mkdir(parents=True, exist_ok=True)
+        rendered = [self._render(**spec) for spec in specs]
+        _write_all([(path, content) for path, content, _ in rendered])
+        return [result for _, _, result in rendered]
+    
+    def _render(
+        self,
+        name: str,
+        description: str,
+        capabilities: List[str],
+        skills: List[str],
+        tasks: List[Dict[str, str]]
+    ) -> Tuple[Path, str, Dict[str, Any]]:
+        """Render an agent definition; returns its path, content and the result dict."""
+        caps_str = '\n'.join([f'  - {c}' for c in capabilities])
+        skills_str = '\n'.join([f'  - {s}' for s in skills])
+        tasks_str = '\n'.join([
             f'  - {t["name"]}: "{t["description"]}"'
             for t in tasks
-        )
+        ])
         
         yml_content = self.AGENT_YML_TEMPLATE.format(
             name=name,
@@ -256,9 +364,8 @@ tasks:
         )
         
         yml_path = self.models_dir / f"{name}.yml"
-        yml_path.write_text(yml_content)
         
-        return {
+        return yml_path, yml_content, {
             "status": "success",
             "agent_name": name,
             "file": str(yml_path)
@@ -295,8 +402,9 @@ def run(context, task: str) -> Dict[str, Any]:
     
     # Step 1: Validate capabilities
     required_caps = {capabilities}
+    has_capability = context.has_capability
     for cap in required_caps:
-        if not context.has_capability(cap):
+        if not has_capability(cap):
             return {{
                 "status": "error",
                 "error": "capability_denied",
@@ -342,7 +450,8 @@ def run(context, task: str) -> Dict[str, Any]:
         name: str,
         agent_name: str,
         capabilities: List[str],
-        task_logic: str = None
+        task_logic: str = None,
+        timestamp: Optional[str] = None
     ) -> str:
         """
         Generate a task implementation.
@@ -352,6 +461,8 @@ def run(context, task: str) -> Dict[str, Any]:
             agent_name: Agent this task belongs to
             capabilities: Required capabilities
             task_logic: Optional custom logic (Python code)
+            timestamp: "Generated" stamp (default: now, ISO format);
+                pin it for reproducible output
         
         Returns:
             Generated Python code as string
@@ -361,20 +472,31 @@ def run(context, task: str) -> Dict[str, Any]:
         result = {"message": "Task not implemented"}'''
         
         # Indent task logic
-        task_logic = '\n'.join(
+        task_logic = '\n'.join([
             '        ' + line if line.strip() else ''
             for line in task_logic.split('\n')
-        )
+        ])
         
         code = self.TASK_TEMPLATE.format(
             name=name,
             agent_name=agent_name,
-            timestamp=datetime.now().isoformat(),
-            capabilities=repr(capabilities),
+            timestamp=timestamp or datetime.now().isoformat(),
+            # A tuple of constants is built once, at compile time
+            capabilities=repr(tuple(capabilities)),
             task_logic=task_logic
         )
         
         return code
+    
+    def generate_many(self, specs: List[Dict[str, Any]]) -> List[str]:
+        """
+        Generate several task implementations with one shared timestamp.
+        
+        Each spec holds the keyword arguments of generate(); a batch gets
+        a single "Generated" stamp unless a spec pins its own.
+        """
+        timestamp = datetime.now().isoformat()
+        return [self.generate(**{"timestamp": timestamp, **spec}) for spec in specs]
 
 
 # Convenience functions
@@ -407,15 +529,17 @@ def generate_task(
     name: str,
     agent_name: str,
     capabilities: List[str],
-    task_logic: str = None
+    task_logic: str = None,
+    timestamp: Optional[str] = None
 ) -> str:
     """Generate task code."""
     gen = TaskGenerator()
-    return gen.generate(name, agent_name, capabilities, task_logic)
+    return gen.generate(name, agent_name, capabilities, task_logic, timestamp)
 
 
 if __name__ == "__main__":
     import argparse
+    import json
     
     parser = argparse.ArgumentParser(description="Agent Framework Generator")
     parser.add_argument("type", choices=["skill", "agent", "task"])
@@ -20,7 +20,7 @@ class NodeStatus(Enum):
     SKIPPED = "skipped"
 
 
-@dataclass
+@dataclass(slots=True)
 class Node:
     """A node in the execution graph."""
     id: str
@@ -32,7 +32,7 @@ class Node:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Edge:
     """An edge connecting two nodes."""
     source: str
@@ -55,6 +55,10 @@ class GraphEngine:
         self.agents_root = Path(agents_root)
         self.nodes: Dict[str, Node] = {}
         self.edges: List[Edge] = []
+        # Adjacency list (dependency -> dependents), kept in step with edges
+        self._successors: Dict[str, List[str]] = {}
+        # Edges are only ever added, so once a cycle appears it stays
+        self._acyclic = True
     
     def add_node(self, node_id: str, agent: str, task: str, depends_on: List[str] = None) -> Node:
         """Add a node to the graph."""
@@ -69,6 +73,11 @@ class GraphEngine:
         # Create edges for dependencies
         for dep in node.dependencies:
             self.edges.append(Edge(source=dep, target=node_id))
+            self._successors.setdefault(dep, []).append(node_id)
+        
+        # Every new edge ends at this node, so any new cycle runs through it
+        if self._acyclic and node.dependencies and self._reaches(node_id, node.dependencies):
+            self._acyclic = False
         
         return node
     
@@ -89,40 +98,34 @@ class GraphEngine:
         return {"valid": len(issues) == 0, "issues": issues}
     
     def _has_cycle(self) -> bool:
-        """Detect cycles using DFS."""
-        visited = set()
-        rec_stack = set()
-        
-        def dfs(node_id: str) -> bool:
-            visited.add(node_id)
-            rec_stack.add(node_id)
-            
-            for edge in self.edges:
-                if edge.source == node_id:
-                    if edge.target not in visited:
-                        if dfs(edge.target):
-                            return True
-                    elif edge.target in rec_stack:
-                        return True
-            
-            rec_stack.remove(node_id)
-            return False
-        
-        for node_id in self.nodes:
-            if node_id not in visited:
-                if dfs(node_id):
+        """Detect cycles (tracked incrementally by add_node)."""
+        return not self._acyclic
+    
+    def _reaches(self, start: str, targets: List[str]) -> bool:
+        """Whether any of targets is start or reachable from it along edges."""
+        wanted = set(targets)
+        if start in wanted:
+            return True
+        seen = {start}
+        stack = [start]
+        while stack:
+            for child in self._successors.get(stack.pop(), ()):
+                if child in wanted:
                     return True
+                if child not in seen:
+                    seen.add(child)
+                    stack.append(child)
         return False
     
     def get_ready_nodes(self) -> List[Node]:
         """Get nodes ready for execution (all deps satisfied)."""
         ready = []
         for node in self.nodes.values():
-            if node.status != NodeStatus.PENDING:
+            if node.status is not NodeStatus.PENDING:
                 continue
             
             deps_satisfied = all(
-                self.nodes[dep].status == NodeStatus.SUCCESS
+                self.nodes[dep].status is NodeStatus.SUCCESS
                 for dep in node.dependencies
             )
             
@@ -142,13 +145,25 @@ class GraphEngine:
         daemon = AgentDaemon(self.agents_root)
         executed = []
         
-        while True:
-            ready = self.get_ready_nodes()
-            if not ready:
-                break
+        # Kahn's algorithm: count each pending node's unfinished dependencies
+        # and release dependents as those succeed, instead of re-scanning
+        # every node per round. Each wave holds the nodes that became ready
+        # in the previous one, in graph order.
+        order = {node_id: i for i, node_id in enumerate(self.nodes)}
+        waiting = {
+            node_id: sum(1 for dep in node.dependencies
+                         if self.nodes[dep].status is not NodeStatus.SUCCESS)
+            for node_id, node in self.nodes.items()
+            if node.status is NodeStatus.PENDING
+        }
+        ready = [node_id for node_id, count in waiting.items() if count == 0]
+        
+        while ready:
+            next_ready = []
             
             # Execute ready nodes (could be parallel)
-            for node in ready:
+            for node_id in ready:
+                node = self.nodes[node_id]
                 node.status = NodeStatus.RUNNING
                 try:
                     result = daemon.run_task(node.agent, node.task)
@@ -159,9 +174,19 @@ class GraphEngine:
                     node.status = NodeStatus.FAILED
                 
                 executed.append(node.id)
+                
+                if node.status is NodeStatus.SUCCESS:
+                    for dependent in self._successors.get(node_id, ()):
+                        if dependent in waiting:
+                            waiting[dependent] -= 1
+                            if waiting[dependent] == 0:
+                                next_ready.append(dependent)
+            
+            next_ready.sort(key=order.__getitem__)
+            ready = next_ready
         
         # Check for unexecuted nodes
-        pending = [n.id for n in self.nodes.values() if n.status == NodeStatus.PENDING]
+        pending = [n.id for n in self.nodes.values() if n.status is NodeStatus.PENDING]
         
         return {
             "status": "success" if not pending else "partial",
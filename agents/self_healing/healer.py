@@ -2,23 +2,36 @@
 
 import os
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List
 
+# Try to import orjson (faster memory file validation)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
-class PrefixDetector:
-    """Detect prefix path issues."""
-    
-    def detect(self, agents_root: Path) -> List[Dict[str, Any]]:
-        issues = []
-        for f in agents_root.rglob("*.py"):
-            try:
-                content = f.read_text()
-                if "com.termux/" in content and "com.termux" not in content:
-                    issues.append({"file": str(f), "issue": "wrong_prefix"})
-            except:
-                pass
-        return issues
+
+# Threads used by MemoryHealer to reset files
+HEAL_WORKERS = 8
+
+
+def _is_valid_json(raw: bytes) -> bool:
+    """Check that raw bytes parse as JSON, with orjson when available."""
+    if HAS_ORJSON:
+        try:
+            orjson.loads(raw)
+            return True
+        except orjson.JSONDecodeError:
+            # orjson is stricter (NaN, huge ints); let json have the final say
+            pass
+    try:
+        json.loads(raw.decode("utf-8"))
+        return True
+    except ValueError:
+        return False
 
 
 class SandboxDetector:
@@ -40,10 +53,7 @@ class MemoryDetector:
         memory_dir = agents_root / "memory"
         if memory_dir.exists():
             for f in memory_dir.glob("*.json"):
-                try:
-                    with open(f) as fp:
-                        json.load(fp)
-                except json.JSONDecodeError:
+                if not _is_valid_json(f.read_bytes()):
                     issues.append({"file": str(f), "issue": "invalid_json"})
         return issues
 
@@ -63,14 +73,19 @@ class MemoryHealer:
     """Reset corrupted memory files."""
     
     def heal(self, agents_root: Path, issues: List[Dict]) -> List[str]:
-        healed = []
-        for issue in issues:
-            if issue.get("issue") == "invalid_json":
-                path = Path(issue["file"])
-                path.rename(path.with_suffix(".json.bak"))
-                path.write_text("{}")
-                healed.append(f"Reset {path}")
-        return healed
+        paths = [Path(i["file"]) for i in issues if i.get("issue") == "invalid_json"]
+        if len(paths) > 1:
+            with ThreadPoolExecutor(max_workers=min(HEAL_WORKERS, len(paths))) as pool:
+                return list(pool.map(self._reset, paths))
+        return [self._reset(path) for path in paths]
+    
+    @staticmethod
+    def _reset(path: Path) -> str:
+        """Move a corrupted file aside to .json.bak and replace it with {}."""
+        os.replace(path, path.with_suffix(".json.bak"))
+        with open(path, 'wb') as f:
+            f.write(b"{}")
+        return f"Reset {path}"
 
 
 class SelfHealingMode:
@@ -78,22 +93,35 @@ class SelfHealingMode:
     
     def __init__(self, agents_root: Path):
         self.agents_root = Path(agents_root)
-        self.detectors = [PrefixDetector(), SandboxDetector(), MemoryDetector()]
+        self.detectors = [SandboxDetector(), MemoryDetector()]
         self.healers = {"sandbox": SandboxHealer(), "memory": MemoryHealer()}
     
     def diagnose(self) -> Dict[str, Any]:
-        all_issues = []
-        for detector in self.detectors:
-            all_issues.extend(detector.detect(self.agents_root))
+        # Detectors are I/O bound and independent: run them concurrently;
+        # map() keeps the issues in detector order
+        with ThreadPoolExecutor(max_workers=max(1, len(self.detectors))) as pool:
+            results = list(pool.map(
+                lambda detector: detector.detect(self.agents_root),
+                self.detectors
+            ))
+        all_issues = [issue for issues in results for issue in issues]
         return {"issues": all_issues, "count": len(all_issues)}
     
     def heal(self) -> Dict[str, Any]:
         diagnosis = self.diagnose()
         healed = []
-        sandbox_issues = [i for i in diagnosis["issues"] if "sandbox" in str(i)]
+        # One pass, matching on the issue name rather than the dict's repr
+        # (which also matched file paths that happen to contain "sandbox")
+        sandbox_issues = []
+        memory_issues = []
+        for i in diagnosis["issues"]:
+            name = str(i.get("issue", ""))
+            if "sandbox" in name:
+                sandbox_issues.append(i)
+            if "json" in name:
+                memory_issues.append(i)
         if sandbox_issues:
             healed.extend(self.healers["sandbox"].heal(self.agents_root, sandbox_issues))
-        memory_issues = [i for i in diagnosis["issues"] if "json" in str(i.get("issue", ""))]
         if memory_issues:
             healed.extend(self.healers["memory"].heal(self.agents_root, memory_issues))
         return {"diagnosed": diagnosis["count"], "healed": healed}
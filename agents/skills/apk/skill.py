@@ -6,11 +6,206 @@ Provides Android APK analysis and manipulation.
 Uses apktool, jadx, aapt, etc.
 """
 
-from typing import Any, Dict, List, Optional
+import copy
+import os
+import re
+import struct
+import zipfile
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set, Tuple
 from pathlib import Path
 from agents.skills.base import Skill, SkillResult
 
 
+# Binary XML (AXML) chunk types and value types, from AOSP ResourceTypes.h
+_RES_STRING_POOL_TYPE = 0x0001
+_RES_XML_TYPE = 0x0003
+_RES_XML_START_ELEMENT_TYPE = 0x0102
+_RES_XML_RESOURCE_MAP_TYPE = 0x0180
+_UTF8_FLAG = 0x100
+_NO_INDEX = 0xFFFFFFFF
+_TYPE_STRING = 0x03
+_TYPE_FIRST_INT = 0x10
+_TYPE_LAST_INT = 0x1F
+
+# Manifest attributes reported by analyze(), keyed by android: resource id
+# (reliable even when attribute names are stripped) and by name
+_ATTR_IDS = {
+    0x0101021B: "versionCode",
+    0x0101021C: "versionName",
+    0x0101020C: "minSdk",
+    0x01010270: "targetSdk",
+    0x01010001: "label",
+}
+_ATTR_NAMES = {
+    "package": "package",
+    "versionCode": "versionCode",
+    "versionName": "versionName",
+    "minSdkVersion": "minSdk",
+    "targetSdkVersion": "targetSdk",
+    "label": "label",
+}
+_ELEMENT_ATTRS = {
+    "manifest": {"package", "versionCode", "versionName"},
+    "uses-sdk": {"minSdk", "targetSdk"},
+    "application": {"label"},
+}
+
+
+# `aapt dump badging` output: attributes of the package: line, and the
+# single-value lines analyze() reports
+_PACKAGE_ATTR_RE = re.compile(r"(name|versionCode|versionName)='([^']+)'")
+_PACKAGE_KEYS = {"name": "package", "versionCode": "versionCode", "versionName": "versionName"}
+_BADGING_FIELDS = {
+    "application-label": "label",
+    "sdkVersion": "minSdk",
+    "targetSdkVersion": "targetSdk",
+}
+
+# Entries kept in each ApkSkill's cache of analyze/get_manifest/list_classes results
+ANALYSIS_CACHE_SIZE = 256
+
+
+def _cache_key(kind: str, apk: Path) -> tuple:
+    st = apk.stat()
+    return (kind, os.path.realpath(apk), st.st_mtime_ns, st.st_size)
+
+
+class _StringPool:
+    """AXML string pool; strings are decoded on first use."""
+    
+    def __init__(self, data: memoryview, offset: int):
+        (_, header_size, _, count, _, flags,
+         strings_start, _) = struct.unpack_from("<HHIIIIII", data, offset)
+        self._data = data
+        self._offsets = struct.unpack_from(f"<{count}I", data, offset + header_size)
+        self._base = offset + strings_start
+        self._utf8 = bool(flags & _UTF8_FLAG)
+        self._cache: Dict[int, str] = {}
+    
+    def get(self, index: int) -> Optional[str]:
+        if index >= len(self._offsets):
+            return None
+        cached = self._cache.get(index)
+        if cached is not None:
+            return cached
+        data = self._data
+        pos = self._base + self._offsets[index]
+        if self._utf8:
+            # UTF-16 length (skipped), then UTF-8 byte length; 1 or 2 bytes each
+            pos += 2 if data[pos] & 0x80 else 1
+            length = data[pos]
+            if length & 0x80:
+                length = ((length & 0x7F) << 8) | data[pos + 1]
+                pos += 1
+            pos += 1
+            value = bytes(data[pos:pos + length]).decode("utf-8", "replace")
+        else:
+            length, = struct.unpack_from("<H", data, pos)
+            pos += 2
+            if length & 0x8000:
+                low, = struct.unpack_from("<H", data, pos)
+                length = ((length & 0x7FFF) << 16) | low
+                pos += 2
+            value = bytes(data[pos:pos + 2 * length]).decode("utf-16-le", "replace")
+        self._cache[index] = value
+        return value
+
+
+def _attr_value(pool: _StringPool, raw: int, value_type: int, data: int) -> Optional[str]:
+    """Attribute value as aapt prints it; None for resource references."""
+    if value_type == _TYPE_STRING:
+        return pool.get(raw if raw != _NO_INDEX else data)
+    if _TYPE_FIRST_INT <= value_type <= _TYPE_LAST_INT:
+        return str(data - 0x100000000 if data & 0x80000000 else data)
+    if raw != _NO_INDEX:
+        return pool.get(raw)
+    return None
+
+
+def _parse_manifest_lite(apk_path: Path) -> Tuple[Dict[str, str], Set[str]]:
+    """
+    Read package, version and SDK info straight from the binary manifest.
+    
+    Reads only AndroidManifest.xml from the APK and walks its chunks up to
+    the <application> element, decoding just the strings it looks at.
+    Returns the info and the keys whose values are resource references
+    (e.g. android:label="@string/app_name"), which need resources.arsc.
+    Raises on anything unexpected so the caller can fall back to aapt.
+    """
+    with zipfile.ZipFile(apk_path) as zf:
+        data = memoryview(zf.read("AndroidManifest.xml"))
+    
+    chunk_type, offset, total = struct.unpack_from("<HHI", data, 0)
+    if chunk_type != _RES_XML_TYPE:
+        raise ValueError("AndroidManifest.xml is not binary XML")
+    end = min(total, len(data))
+    
+    pool: Optional[_StringPool] = None
+    resource_ids: tuple = ()
+    info: Dict[str, str] = {}
+    references: Set[str] = set()
+    
+    while offset + 8 <= end:
+        chunk_type, header_size, size = struct.unpack_from("<HHI", data, offset)
+        if size < 8:
+            raise ValueError(f"Bad chunk size {size} at {offset}")
+        
+        if chunk_type == _RES_STRING_POOL_TYPE and pool is None:
+            pool = _StringPool(data, offset)
+        elif chunk_type == _RES_XML_RESOURCE_MAP_TYPE:
+            count = (size - header_size) // 4
+            resource_ids = struct.unpack_from(f"<{count}I", data, offset + header_size)
+        elif chunk_type == _RES_XML_START_ELEMENT_TYPE:
+            if pool is None:
+                raise ValueError("Element before string pool")
+            ext = offset + header_size
+            _, name, attr_start, attr_size, attr_count = struct.unpack_from("<IIHHH", data, ext)
+            element = pool.get(name)
+            wanted = _ELEMENT_ATTRS.get(element)
+            if wanted:
+                for i in range(attr_count):
+                    (_, attr_name, raw, _, _, value_type,
+                     value) = struct.unpack_from("<IIIHBBI", data, ext + attr_start + i * attr_size)
+                    key = None
+                    if attr_name < len(resource_ids):
+                        key = _ATTR_IDS.get(resource_ids[attr_name])
+                    if key is None:
+                        key = _ATTR_NAMES.get(pool.get(attr_name))
+                    if key in wanted:
+                        text = _attr_value(pool, raw, value_type, value)
+                        if text is not None:
+                            info[key] = text
+                        else:
+                            references.add(key)
+            if element == "application":
+                break
+        offset += size
+    
+    if "package" not in info:
+        raise ValueError("No package attribute in manifest")
+    return info, references
+
+
+def _parse_badging(output: str) -> Dict[str, str]:
+    """The fields analyze() reports, from `aapt dump badging` output."""
+    info: Dict[str, str] = {}
+    for line in output.split("\n"):
+        field, _, value = line.partition(":")
+        if field == "package":
+            # Parse package info; the first occurrence of each key
+            # counts (later ones are e.g. compileSdkVersionCodename=)
+            found: Dict[str, str] = {}
+            for match in _PACKAGE_ATTR_RE.finditer(line):
+                found.setdefault(_PACKAGE_KEYS[match.group(1)], match.group(2))
+            for name in _PACKAGE_KEYS.values():
+                if name in found:
+                    info[name] = found[name]
+        elif field in _BADGING_FIELDS:
+            info[_BADGING_FIELDS[field]] = value.strip().strip("'")
+    return info
+
+
 class ApkSkill(Skill):
     """Android APK analysis skill."""
     
@@ -22,6 +217,29 @@ class ApkSkill(Skill):
     ]
     requires_capabilities = ["exec.apk", "filesystem.read", "filesystem.write"]
     
+    def __init__(self, executor, sandbox, memory):
+        super().__init__(executor, sandbox, memory)
+        # Results keyed by (function, real path, mtime_ns, size), so a
+        # rebuilt APK misses; least recently used evicted first. agentd
+        # reuses an agent's instance across tasks, so this outlives a task.
+        self._analysis_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+    
+    def _cache_get(self, key: tuple, apk: Path) -> Optional[Dict[str, Any]]:
+        """Copy of a cached result (reporting the path as given), or None."""
+        result = self._analysis_cache.get(key)
+        if result is None:
+            return None
+        self._analysis_cache.move_to_end(key)
+        result = copy.deepcopy(result)
+        result["apk"] = str(apk)
+        return result
+    
+    def _cache_put(self, key: tuple, result: Dict[str, Any]) -> None:
+        self._analysis_cache[key] = copy.deepcopy(result)
+        self._analysis_cache.move_to_end(key)
+        while len(self._analysis_cache) > ANALYSIS_CACHE_SIZE:
+            self._analysis_cache.popitem(last=False)
+    
     def get_functions(self) -> Dict[str, callable]:
         return {
             "decode": self.decode,
@@ -136,38 +354,44 @@ class ApkSkill(Skill):
         if not apk.exists():
             return {"error": f"APK not found: {apk_path}"}
         
-        # Use aapt to get basic info
-        result = self.executor.run(
-            ["aapt", "dump", "badging", str(apk)],
-            check=False
-        )
+        key = _cache_key("analyze", apk)
+        cached = self._cache_get(key, apk)
+        if cached is not None:
+            return cached
         
         info = {
             "apk": str(apk),
             "size": apk.stat().st_size
         }
         
+        # Read the binary manifest in-process. aapt is still run for
+        # manifests the lite parser does not understand, and to resolve
+        # values given as resource references (usually the label).
+        references: Set[str] = set()
+        try:
+            lite, references = _parse_manifest_lite(apk)
+        except (OSError, KeyError, ValueError, IndexError,
+                struct.error, zipfile.BadZipFile) as e:
+            self.log(f"Lite manifest parse failed ({e}), using aapt")
+        else:
+            info.update(lite)
+            if not references:
+                self._cache_put(key, info)
+                return info
+            self.log(f"Resolving {', '.join(sorted(references))} with aapt")
+        
+        # Use aapt to get basic info
+        result = self.executor.run(
+            ["aapt", "dump", "badging", str(apk)],
+            check=False
+        )
+        
         if result.stdout:
-            for line in result.stdout.split("\n"):
-                if line.startswith("package:"):
-                    # Parse package info
-                    import re
-                    match = re.search(r"name='([^']+)'", line)
-                    if match:
-                        info["package"] = match.group(1)
-                    match = re.search(r"versionCode='([^']+)'", line)
-                    if match:
-                        info["versionCode"] = match.group(1)
-                    match = re.search(r"versionName='([^']+)'", line)
-                    if match:
-                        info["versionName"] = match.group(1)
-                elif line.startswith("application-label:"):
-                    info["label"] = line.split(":", 1)[1].strip().strip("'")
-                elif line.startswith("sdkVersion:"):
-                    info["minSdk"] = line.split(":", 1)[1].strip().strip("'")
-                elif line.startswith("targetSdkVersion:"):
-                    info["targetSdk"] = line.split(":", 1)[1].strip().strip("'")
+            info.update(_parse_badging(result.stdout))
         
+        # Not cached while a reference is unresolved (e.g. aapt missing)
+        if "package" in info and references <= info.keys():
+            self._cache_put(key, info)
         return info
     
     def extract(self, apk_path: str, output_dir: Optional[str] = None, **kwargs) -> Dict[str, Any]:
@@ -202,16 +426,24 @@ class ApkSkill(Skill):
         if not apk.exists():
             return {"error": f"APK not found: {apk_path}"}
         
+        key = _cache_key("get_manifest", apk)
+        cached = self._cache_get(key, apk)
+        if cached is not None:
+            return cached
+        
         result = self.executor.run(
             ["aapt", "dump", "xmltree", str(apk), "AndroidManifest.xml"],
             check=False
         )
         
-        return {
+        manifest = {
             "apk": str(apk),
             "manifest": result.stdout if result.returncode == 0 else None,
             "error": result.stderr if result.returncode != 0 else None
         }
+        if result.returncode == 0:
+            self._cache_put(key, manifest)
+        return manifest
     
     def list_classes(self, apk_path: str, **kwargs) -> Dict[str, Any]:
         """List classes in APK using jadx."""
@@ -221,6 +453,11 @@ class ApkSkill(Skill):
         if not apk.exists():
             return {"error": f"APK not found: {apk_path}"}
         
+        key = _cache_key("list_classes", apk)
+        cached = self._cache_get(key, apk)
+        if cached is not None:
+            return cached
+        
         # Use jadx to decompile and list
         output_dir = self.sandbox.get_tmp_path(f"{apk.stem}_jadx")
         
@@ -237,11 +474,14 @@ class ApkSkill(Skill):
                 class_name = str(rel_path).replace("/", ".").replace(".java", "")
                 classes.append(class_name)
         
-        return {
+        listing = {
             "apk": str(apk),
             "class_count": len(classes),
             "classes": classes[:100]  # Limit output
         }
+        if classes:
+            self._cache_put(key, listing)
+        return listing
     
     def self_test(self) -> SkillResult:
         """Test APK skill."""
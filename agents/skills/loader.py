@@ -38,6 +38,16 @@ class SkillLoader:
         self._manifests: Dict[str, Dict[str, Any]] = {}
         self._loaded = False
     
+    def invalidate(self, skill_name: Optional[str] = None) -> None:
+        """Drop cached classes and manifests (one skill's, or all) for reload."""
+        if skill_name is not None:
+            self._skill_classes.pop(skill_name, None)
+            self._manifests.pop(skill_name, None)
+            return
+        self._skill_classes.clear()
+        self._manifests.clear()
+        self._loaded = False
+    
     def discover_skills(self) -> List[str]:
         """Discover all available skills."""
         skills = []
@@ -124,14 +134,11 @@ class SkillLoader:
         return self._skill_classes
     
     def get_skill_class(self, skill_name: str) -> Optional[Type[Skill]]:
-        """Get skill class by name."""
-        if not self._loaded:
-            self.load_all()
-        
-        if skill_name not in self._skill_classes:
-            self.load_skill_class(skill_name)
-        
-        return self._skill_classes.get(skill_name)
+        """Get skill class by name (loads only that skill's module)."""
+        skill_class = self._skill_classes.get(skill_name)
+        if skill_class is None:
+            skill_class = self.load_skill_class(skill_name)
+        return skill_class
     
     def get_manifest(self, skill_name: str) -> Optional[Dict[str, Any]]:
         """Get skill manifest by name."""
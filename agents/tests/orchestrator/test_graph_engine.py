@@ -0,0 +1,178 @@
+"""
+Graph Engine Test Suite
+=======================
+
+Tests for DAG validation and execution order.
+Agent tasks are run by a fake daemon that records each call.
+"""
+
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from agents.orchestrator.graph_engine import GraphEngine, NodeStatus
+
+
+class FakeDaemon:
+    """Stands in for AgentDaemon; tasks named "fail"/"raise" do so."""
+    
+    calls: list = []
+    
+    def __init__(self, agents_root: Path):
+        self.agents_root = agents_root
+    
+    def run_task(self, agent: str, task: str) -> Dict[str, Any]:
+        FakeDaemon.calls.append((agent, task))
+        if task == "raise":
+            raise RuntimeError(f"{agent} crashed")
+        return {"status": "failed" if task == "fail" else "success", "task": task}
+
+
+# Test fixtures
+@pytest.fixture
+def engine(monkeypatch, tmp_path):
+    """Create a graph engine whose tasks run on the fake daemon."""
+    monkeypatch.setattr("agents.core.supervisor.agentd.AgentDaemon", FakeDaemon)
+    FakeDaemon.calls = []
+    return GraphEngine(tmp_path)
+
+
+def executed_agents() -> list:
+    """Agents the fake daemon ran, in call order."""
+    return [agent for agent, _ in FakeDaemon.calls]
+
+
+class TestExecutionOrder:
+    """Test nodes run after their dependencies, in graph order."""
+    
+    def test_diamond(self, engine):
+        """Both branches of a diamond run before the join, in insertion order."""
+        engine.add_node("top", "a", "ok")
+        engine.add_node("right", "c", "ok", depends_on=["top"])
+        engine.add_node("left", "b", "ok", depends_on=["top"])
+        engine.add_node("bottom", "d", "ok", depends_on=["left", "right"])
+        
+        result = engine.execute()
+        
+        assert result["status"] == "success"
+        assert result["executed"] == ["top", "right", "left", "bottom"]
+        assert result["pending"] == []
+        assert executed_agents() == ["a", "c", "b", "d"]
+    
+    def test_dependency_added_after_dependent(self, engine):
+        """A dependency declared later in the graph still runs first."""
+        engine.add_node("deploy", "a", "ok", depends_on=["build"])
+        engine.add_node("build", "b", "ok")
+        
+        result = engine.execute()
+        
+        assert result["executed"] == ["build", "deploy"]
+    
+    def test_waves_follow_graph_order(self, engine):
+        """Nodes released in the same wave run in insertion order."""
+        engine.add_node("x", "x", "ok", depends_on=["q"])
+        engine.add_node("y", "y", "ok", depends_on=["p"])
+        engine.add_node("p", "p", "ok")
+        engine.add_node("q", "q", "ok")
+        
+        # p releases y before q releases x, but x comes first in the graph
+        assert engine.execute()["executed"] == ["p", "q", "x", "y"]
+    
+    def test_duplicate_dependencies(self, engine):
+        """A dependency listed twice is waited for once and runs once."""
+        engine.add_node("build", "a", "ok")
+        engine.add_node("test", "b", "ok", depends_on=["build", "build"])
+        
+        result = engine.execute()
+        
+        assert result["status"] == "success"
+        assert result["executed"] == ["build", "test"]
+        assert engine.validate()["valid"]
+    
+    def test_already_succeeded_dependency(self, engine):
+        """A dependency that already succeeded does not block its dependents."""
+        engine.add_node("build", "a", "ok")
+        engine.add_node("test", "b", "ok", depends_on=["build"])
+        engine.nodes["build"].status = NodeStatus.SUCCESS
+        
+        assert engine.execute()["executed"] == ["test"]
+
+
+class TestFailures:
+    """Test failed nodes stop their dependents."""
+    
+    def test_failed_node_leaves_dependents_pending(self, engine):
+        """Dependents of a failed node stay pending; the run is partial."""
+        engine.add_node("build", "a", "fail")
+        engine.add_node("test", "b", "ok", depends_on=["build"])
+        engine.add_node("deploy", "c", "ok", depends_on=["test"])
+        engine.add_node("docs", "d", "ok")
+        
+        result = engine.execute()
+        
+        assert result["status"] == "partial"
+        assert result["executed"] == ["build", "docs"]
+        assert result["pending"] == ["test", "deploy"]
+        assert engine.nodes["build"].status is NodeStatus.FAILED
+    
+    def test_exception_marks_node_failed(self, engine):
+        """A task that raises fails its node and records the error."""
+        engine.add_node("build", "a", "raise")
+        engine.add_node("test", "b", "ok", depends_on=["build"])
+        
+        result = engine.execute()
+        
+        assert result["status"] == "partial"
+        assert engine.nodes["build"].error == "a crashed"
+        assert result["pending"] == ["test"]
+    
+    def test_one_failed_dependency_of_many(self, engine):
+        """A join waits for all its dependencies, so one failure blocks it."""
+        engine.add_node("left", "a", "ok")
+        engine.add_node("right", "b", "fail")
+        engine.add_node("join", "c", "ok", depends_on=["left", "right"])
+        
+        result = engine.execute()
+        
+        assert result["executed"] == ["left", "right"]
+        assert result["pending"] == ["join"]
+
+
+class TestValidation:
+    """Test cycle and missing-dependency detection."""
+    
+    def test_cycle_through_forward_reference(self, engine):
+        """A cycle closed by a node added later is detected."""
+        engine.add_node("a", "x", "ok", depends_on=["c"])
+        engine.add_node("b", "x", "ok", depends_on=["a"])
+        assert "Graph contains a cycle" not in engine.validate()["issues"]
+        engine.add_node("c", "x", "ok", depends_on=["b"])
+        
+        validation = engine.validate()
+        
+        assert not validation["valid"]
+        assert "Graph contains a cycle" in validation["issues"]
+        assert engine.execute()["error"] == "invalid_graph"
+        assert FakeDaemon.calls == []
+    
+    def test_self_dependency(self, engine):
+        """A node depending on itself is a cycle."""
+        engine.add_node("a", "x", "ok", depends_on=["a"])
+        assert not engine.validate()["valid"]
+    
+    def test_converging_paths_are_not_a_cycle(self, engine):
+        """Two paths to the same node do not count as a cycle."""
+        engine.add_node("a", "x", "ok")
+        engine.add_node("b", "x", "ok", depends_on=["a"])
+        engine.add_node("c", "x", "ok", depends_on=["a", "b"])
+        assert engine.validate() == {"valid": True, "issues": []}
+    
+    def test_missing_dependency(self, engine):
+        """A dependency on an unknown node is reported."""
+        engine.add_node("a", "x", "ok", depends_on=["ghost"])
+        
+        validation = engine.validate()
+        
+        assert validation["issues"] == ["Node 'a' depends on missing node 'ghost'"]
+        assert engine.execute()["status"] == "error"
@@ -0,0 +1,281 @@
+"""
+APK Manifest Parsing Tests
+==========================
+
+Tests for reading APK info from the binary manifest (AXML) without aapt.
+Uses small hand-built manifests; aapt is mocked.
+"""
+
+import struct
+import tempfile
+import zipfile
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from agents.skills.apk.skill import ApkSkill, _parse_manifest_lite
+
+
+ANDROID_NS = "http://schemas.android.com/apk/res/android"
+NO_INDEX = 0xFFFFFFFF
+
+# android: attribute resource ids; these names come first in the pool
+ATTR_IDS = {
+    "versionCode": 0x0101021B,
+    "versionName": 0x0101021C,
+    "minSdkVersion": 0x0101020C,
+    "targetSdkVersion": 0x01010270,
+    "label": 0x01010001,
+    "name": 0x01010003,
+}
+
+BADGING = (
+    "package: name='com.example.app' versionCode='42' versionName='4.2' "
+    "compileSdkVersion='34' compileSdkVersionCodename='14'\n"
+    "sdkVersion:'21'\n"
+    "targetSdkVersion:'34'\n"
+    "application-label:'Example'\n"
+)
+
+
+def string_pool(strings, utf8: bool) -> bytes:
+    """Encode a ResStringPool chunk."""
+    offsets, blob = [], b""
+    for s in strings:
+        offsets.append(len(blob))
+        if utf8:
+            encoded = s.encode("utf-8")
+            def length(n):
+                return bytes([n]) if n < 0x80 else bytes([0x80 | (n >> 8), n & 0xFF])
+            blob += length(len(s)) + length(len(encoded)) + encoded + b"\0"
+        else:
+            n = len(s)
+            prefix = (struct.pack("<H", n) if n < 0x8000
+                      else struct.pack("<HH", 0x8000 | (n >> 16), n & 0xFFFF))
+            blob += prefix + s.encode("utf-16-le") + b"\0\0"
+    blob += b"\0" * (-len(blob) % 4)
+    strings_start = 28 + 4 * len(strings)
+    header = struct.pack("<HHIIIIII", 0x0001, 28, strings_start + len(blob),
+                         len(strings), 0, 0x100 if utf8 else 0, strings_start, 0)
+    return header + struct.pack(f"<{len(strings)}I", *offsets) + blob
+
+
+def axml(elements, utf8: bool = True, strip_names: bool = False) -> bytes:
+    """
+    Encode a binary manifest.
+    
+    ``elements`` is a list of (tag, attrs); each attr is
+    (android_ns, name, kind, value) with kind "s" (string), "i" (int)
+    or "r" (resource reference).
+    """
+    strings = list(ATTR_IDS)
+    
+    def idx(s):
+        if s not in strings:
+            strings.append(s)
+        return strings.index(s)
+    
+    body = struct.pack("<HHIIIII", 0x0100, 16, 24, 1, NO_INDEX,
+                       idx("android"), idx(ANDROID_NS))
+    for tag, attrs in elements:
+        attr_bytes = b""
+        for android_ns, name, kind, value in attrs:
+            ns = idx(ANDROID_NS) if android_ns else NO_INDEX
+            if kind == "s":
+                raw, value_type, data = idx(value), 0x03, idx(value)
+            elif kind == "i":
+                raw, value_type, data = NO_INDEX, 0x10, value & 0xFFFFFFFF
+            else:
+                raw, value_type, data = NO_INDEX, 0x01, value
+            attr_bytes += struct.pack("<IIIHBBI", ns, idx(name), raw, 8, 0, value_type, data)
+        ext = struct.pack("<IIHHHHHH", NO_INDEX, idx(tag), 20, 20, len(attrs), 0, 0, 0)
+        body += struct.pack("<HHIII", 0x0102, 16, 16 + len(ext) + len(attr_bytes),
+                            1, NO_INDEX) + ext + attr_bytes
+    for tag, _ in reversed(elements):
+        body += struct.pack("<HHIIIII", 0x0103, 16, 24, 1, NO_INDEX, NO_INDEX, idx(tag))
+    
+    if strip_names:
+        # Shrinkers blank the names of attributes that have resource ids
+        strings[:len(ATTR_IDS)] = [""] * len(ATTR_IDS)
+    resource_map = struct.pack(f"<{len(ATTR_IDS)}I", *ATTR_IDS.values())
+    content = (string_pool(strings, utf8)
+               + struct.pack("<HHI", 0x0180, 8, 8 + len(resource_map)) + resource_map
+               + body)
+    return struct.pack("<HHI", 0x0003, 8, 8 + len(content)) + content
+
+
+def manifest(label=(1, "label", "s", "Example"), version_name="4.2"):
+    """Typical manifest elements."""
+    return [
+        ("manifest", [(0, "package", "s", "com.example.app"),
+                      (1, "versionCode", "i", 42),
+                      (1, "versionName", "s", version_name)]),
+        ("uses-sdk", [(1, "minSdkVersion", "i", 21),
+                      (1, "targetSdkVersion", "i", 34)]),
+        ("application", [label, (1, "name", "s", "com.example.App")]),
+        ("activity", [(1, "label", "s", "Not the app label")]),
+    ]
+
+
+# Test fixtures
+@pytest.fixture
+def apk_dir():
+    """Create a temporary directory for APKs."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+@pytest.fixture
+def make_apk(apk_dir):
+    """Write an APK with the given manifest bytes."""
+    def make(manifest_bytes: bytes, name: str = "app.apk") -> Path:
+        path = apk_dir / name
+        with zipfile.ZipFile(path, "w") as zf:
+            zf.writestr("classes.dex", b"dex\n035\0")
+            zf.writestr("AndroidManifest.xml", manifest_bytes)
+        return path
+    return make
+
+
+@pytest.fixture
+def skill():
+    """ApkSkill with a mocked aapt."""
+    executor = MagicMock()
+    executor.run.return_value = SimpleNamespace(stdout=BADGING, stderr="", returncode=0)
+    return ApkSkill(executor, MagicMock(), MagicMock())
+
+
+EXPECTED = {
+    "package": "com.example.app",
+    "versionCode": "42",
+    "versionName": "4.2",
+    "minSdk": "21",
+    "targetSdk": "34",
+    "label": "Example",
+}
+
+
+class TestParseManifestLite:
+    """Test the binary manifest parser."""
+    
+    @pytest.mark.parametrize("utf8", [True, False])
+    def test_string_pool_encodings(self, make_apk, utf8):
+        """UTF-8 and UTF-16 string pools decode the same."""
+        apk = make_apk(axml(manifest(), utf8=utf8))
+        assert _parse_manifest_lite(apk) == (EXPECTED, set())
+    
+    @pytest.mark.parametrize("utf8", [True, False])
+    def test_stripped_attribute_names(self, make_apk, utf8):
+        """Attributes are found by resource id when their names are blank."""
+        apk = make_apk(axml(manifest(), utf8=utf8, strip_names=True))
+        assert _parse_manifest_lite(apk) == (EXPECTED, set())
+    
+    @pytest.mark.parametrize("utf8", [True, False])
+    def test_non_ascii_and_long_strings(self, make_apk, utf8):
+        """Multi-byte characters and two-byte length prefixes decode."""
+        name = "Version é中 " + "v" * 300
+        apk = make_apk(axml(manifest(version_name=name), utf8=utf8))
+        info, _ = _parse_manifest_lite(apk)
+        assert info["versionName"] == name
+    
+    def test_resource_references_reported(self, make_apk):
+        """Values given as resource references are returned as unresolved."""
+        apk = make_apk(axml(manifest(label=(1, "label", "r", 0x7F0A0001))))
+        info, references = _parse_manifest_lite(apk)
+        assert "label" not in info
+        assert references == {"label"}
+    
+    def test_negative_int(self, make_apk):
+        """Integer attributes are signed, as aapt prints them."""
+        elements = [("manifest", [(0, "package", "s", "p"),
+                                  (1, "versionCode", "i", -5)])]
+        info, _ = _parse_manifest_lite(make_apk(axml(elements)))
+        assert info["versionCode"] == "-5"
+    
+    def test_not_a_zip(self, apk_dir):
+        """A file that is not a zip raises."""
+        path = apk_dir / "bad.apk"
+        path.write_bytes(b"not a zip")
+        with pytest.raises(zipfile.BadZipFile):
+            _parse_manifest_lite(path)
+    
+    def test_text_manifest(self, make_apk):
+        """A plain-text manifest is rejected."""
+        with pytest.raises(ValueError):
+            _parse_manifest_lite(make_apk(b"<manifest package='x'/>"))
+    
+    def test_truncated_manifest(self, make_apk):
+        """A manifest cut short raises instead of returning partial info."""
+        with pytest.raises((ValueError, struct.error)):
+            _parse_manifest_lite(make_apk(axml(manifest())[:60]))
+    
+    def test_missing_package(self, make_apk):
+        """A manifest without a package attribute raises."""
+        elements = [("manifest", [(1, "versionCode", "i", 1)])]
+        with pytest.raises(ValueError):
+            _parse_manifest_lite(make_apk(axml(elements)))
+
+
+class TestAnalyze:
+    """Test ApkSkill.analyze chooses between the lite parser and aapt."""
+    
+    def test_lite_parse_skips_aapt(self, skill, make_apk):
+        """A fully resolved manifest needs no aapt run."""
+        apk = make_apk(axml(manifest()))
+        info = skill.analyze(str(apk))
+        assert skill.executor.run.call_count == 0
+        assert {k: info[k] for k in EXPECTED} == EXPECTED
+    
+    def test_label_reference_uses_aapt(self, skill, make_apk):
+        """A label given as a resource reference is resolved by aapt."""
+        apk = make_apk(axml(manifest(label=(1, "label", "r", 0x7F0A0001))))
+        info = skill.analyze(str(apk))
+        assert skill.executor.run.call_count == 1
+        assert info["label"] == "Example"
+    
+    def test_reference_unresolved_without_aapt(self, skill, make_apk):
+        """Without aapt output the lite info is kept but not cached."""
+        skill.executor.run.return_value = SimpleNamespace(stdout="", stderr="", returncode=1)
+        apk = make_apk(axml(manifest(label=(1, "label", "r", 0x7F0A0001))))
+        info = skill.analyze(str(apk))
+        assert info["package"] == "com.example.app"
+        assert "label" not in info
+        skill.analyze(str(apk))
+        assert skill.executor.run.call_count == 2
+    
+    def test_malformed_manifest_falls_back(self, skill, apk_dir):
+        """A file the lite parser cannot read is analyzed with aapt."""
+        path = apk_dir / "bad.apk"
+        path.write_bytes(b"not a zip")
+        info = skill.analyze(str(path))
+        assert skill.executor.run.call_count == 1
+        assert {k: info[k] for k in EXPECTED} == EXPECTED
+        assert any("Lite manifest parse failed" in line for line in skill.get_logs())
+    
+    def test_result_cached(self, skill, make_apk):
+        """A second analyze of the same file is served from the cache."""
+        apk = make_apk(axml(manifest(label=(1, "label", "r", 0x7F0A0001))))
+        first = skill.analyze(str(apk))
+        second = skill.analyze(str(apk))
+        assert first == second
+        assert skill.executor.run.call_count == 1
+    
+    def test_cache_per_instance(self, skill, make_apk):
+        """Each skill instance keeps its own results."""
+        apk = make_apk(axml(manifest(label=(1, "label", "r", 0x7F0A0001))))
+        skill.analyze(str(apk))
+        other = ApkSkill(skill.executor, MagicMock(), MagicMock())
+        other.analyze(str(apk))
+        assert skill.executor.run.call_count == 2
+    
+    def test_cache_bounded(self, skill, make_apk, monkeypatch):
+        """The least recently used result is evicted past the size limit."""
+        monkeypatch.setattr("agents.skills.apk.skill.ANALYSIS_CACHE_SIZE", 1)
+        first = make_apk(axml(manifest()), name="first.apk")
+        second = make_apk(axml(manifest()), name="second.apk")
+        skill.analyze(str(first))
+        skill.analyze(str(second))
+        assert len(skill._analysis_cache) == 1
+        assert skill.analyze(str(second))["apk"] == str(second)
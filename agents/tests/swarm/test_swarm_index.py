@@ -0,0 +1,274 @@
+"""
+Swarm Index Persistence Tests
+=============================
+
+Tests for the on-disk swarm index: index.json plus the index.log of
+changes appended since it was written.
+Ensures coordinators sharing a directory stay consistent.
+"""
+
+import json
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from agents.core.swarm.swarm import SignalType, SwarmCoordinator
+
+
+# Test fixtures
+@pytest.fixture
+def swarm_dir():
+    """Create a temporary swarm directory."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+def make_coordinator(swarm_dir: Path) -> SwarmCoordinator:
+    """Coordinator whose background flusher stays out of the way."""
+    return SwarmCoordinator(swarm_dir, flush_interval=3600)
+
+
+def read_log(swarm_dir: Path) -> list:
+    """Parsed lines of index.log."""
+    return [json.loads(line) for line in
+            (swarm_dir / "index.log").read_text().splitlines()]
+
+
+class TestSharedDirectory:
+    """Test coordinators on one directory see each other's changes."""
+    
+    def test_emit_visible_after_flush(self, swarm_dir):
+        """A flushed emit is picked up by another coordinator."""
+        writer = make_coordinator(swarm_dir)
+        reader = make_coordinator(swarm_dir)
+        assert reader.sense() == []
+        
+        writer.emit(SignalType.SUCCESS, "agent_a", "task1", data={"k": 1})
+        writer.flush()
+        
+        signals = reader.sense(target="task1")
+        assert len(signals) == 1
+        assert signals[0].source_agent == "agent_a"
+        assert signals[0].data == {"k": 1}
+    
+    def test_emits_appended_to_log(self, swarm_dir):
+        """Flushes append to index.log instead of rewriting index.json."""
+        writer = make_coordinator(swarm_dir)
+        writer.emit(SignalType.SUCCESS, "agent_a", "task1")
+        writer.flush()
+        index_before = (swarm_dir / "index.json").read_bytes()
+        
+        writer.emit(SignalType.FAILURE, "agent_a", "task2")
+        writer.flush()
+        
+        assert (swarm_dir / "index.json").read_bytes() == index_before
+        ops = [entry["op"] for entry in read_log(swarm_dir)]
+        assert ops[0] == "base"
+        assert ops[-1] == "add"
+    
+    def test_reinforce_visible_after_flush(self, swarm_dir):
+        """Reinforcing an existing signal updates it in the other view."""
+        writer = make_coordinator(swarm_dir)
+        reader = make_coordinator(swarm_dir)
+        writer.emit(SignalType.SUCCESS, "agent_a", "task1")
+        writer.flush()
+        assert reader.sense()[0].reinforcement_count == 0
+        
+        writer.emit(SignalType.SUCCESS, "agent_a", "task1")
+        writer.flush()
+        
+        signals = reader.sense()
+        assert len(signals) == 1
+        assert signals[0].reinforcement_count == 1
+    
+    def test_both_writers_kept(self, swarm_dir):
+        """Signals flushed by either coordinator survive the other's flush."""
+        first = make_coordinator(swarm_dir)
+        second = make_coordinator(swarm_dir)
+        first.emit(SignalType.SUCCESS, "agent_a", "task1")
+        second.emit(SignalType.SUCCESS, "agent_b", "task1")
+        first.flush()
+        second.flush()
+        
+        for coordinator in (first, second, make_coordinator(swarm_dir)):
+            agents = sorted(s.source_agent for s in coordinator.sense())
+            assert agents == ["agent_a", "agent_b"]
+    
+    def test_delete_visible_after_flush(self, swarm_dir):
+        """A signal removed by decay disappears from the other view."""
+        writer = make_coordinator(swarm_dir)
+        reader = make_coordinator(swarm_dir)
+        writer.emit(SignalType.SUCCESS, "agent_a", "task1", strength=0.05)
+        writer.emit(SignalType.SUCCESS, "agent_b", "task1")
+        writer.flush()
+        assert len(reader.sense()) == 2
+        
+        writer.decay_all()
+        writer.flush()
+        
+        assert [s.source_agent for s in reader.sense()] == ["agent_b"]
+    
+    def test_agent_name_with_path_separators(self, swarm_dir):
+        """Agent names are not used as file names."""
+        writer = make_coordinator(swarm_dir)
+        writer.emit(SignalType.SUCCESS, "team/a", "task1")
+        writer.emit(SignalType.SUCCESS, "../escape", "task1")
+        writer.flush()
+        
+        assert all(p.parent == swarm_dir / "signals"
+                   for p in (swarm_dir / "signals").rglob("*.json"))
+        agents = sorted(s.source_agent for s in make_coordinator(swarm_dir).sense())
+        assert agents == ["../escape", "team/a"]
+
+
+class TestCompaction:
+    """Test index.log is folded back into index.json."""
+    
+    def test_decay_compacts(self, swarm_dir):
+        """decay_all rewrites index.json and starts an empty log."""
+        writer = make_coordinator(swarm_dir)
+        writer.emit(SignalType.SUCCESS, "agent_a", "task1")
+        writer.emit(SignalType.FAILURE, "agent_b", "task2", strength=0.05)
+        writer.flush()
+        generation = json.loads((swarm_dir / "index.json").read_text())["generation"]
+        
+        writer.decay_all()
+        writer.flush()
+        
+        index = json.loads((swarm_dir / "index.json").read_text())
+        assert index["generation"] != generation
+        assert read_log(swarm_dir) == [{"op": "base", "generation": index["generation"]}]
+        assert list(index["signals"].values())[0]["strength"] == pytest.approx(0.95)
+        assert len(index["signals"]) == 1
+        assert len(list((swarm_dir / "signals").glob("*.json"))) == 1
+    
+    def test_reader_follows_compaction(self, swarm_dir):
+        """A coordinator that read the old log picks up the new index."""
+        writer = make_coordinator(swarm_dir)
+        reader = make_coordinator(swarm_dir)
+        writer.emit(SignalType.SUCCESS, "agent_a", "task1")
+        writer.flush()
+        assert reader.sense()[0].strength == 1.0
+        
+        writer.decay_all()
+        writer.flush()
+        writer.emit(SignalType.SUCCESS, "agent_b", "task2")
+        writer.flush()
+        
+        signals = {s.source_agent: s for s in reader.sense()}
+        assert set(signals) == {"agent_a", "agent_b"}
+        assert signals["agent_a"].strength == pytest.approx(0.95)
+    
+    def test_large_log_compacts(self, swarm_dir, monkeypatch):
+        """A log past LOG_COMPACT_BYTES is compacted on the next flush."""
+        monkeypatch.setattr("agents.core.swarm.swarm.LOG_COMPACT_BYTES", 1)
+        writer = make_coordinator(swarm_dir)
+        writer.emit(SignalType.SUCCESS, "agent_a", "task1")
+        writer.flush()
+        writer.emit(SignalType.SUCCESS, "agent_b", "task2")
+        writer.flush()
+        
+        assert [entry["op"] for entry in read_log(swarm_dir)] == ["base"]
+        index = json.loads((swarm_dir / "index.json").read_text())
+        assert len(index["signals"]) == 2
+
+
+class TestLegacyIndex:
+    """Test indexes written before full records and the log existed."""
+    
+    @pytest.fixture
+    def legacy_dir(self, swarm_dir):
+        """Swarm directory with a metadata-only index.json and signal files."""
+        now = time.time()
+        record = {
+            "id": "a1b2c3d4",
+            "signal_type": "success",
+            "source_agent": "agent_a",
+            "target": "task1",
+            "strength": 0.8,
+            "data": {"k": 1},
+            "created_at": now,
+            "updated_at": now,
+            "ttl": 3600,
+            "reinforcement_count": 2
+        }
+        (swarm_dir / "signals").mkdir()
+        (swarm_dir / "signals" / "a1b2c3d4.json").write_text(json.dumps(record))
+        (swarm_dir / "index.json").write_text(json.dumps({
+            "signals": {
+                "a1b2c3d4": {
+                    "signal_type": "success",
+                    "source_agent": "agent_a",
+                    "target": "task1",
+                    "created_at": now
+                }
+            },
+            "last_decay": now
+        }))
+        return swarm_dir
+    
+    def test_loads_signal_files(self, legacy_dir):
+        """Signals are read from their files when the index lacks records."""
+        signals = make_coordinator(legacy_dir).sense()
+        assert len(signals) == 1
+        assert signals[0].id == "a1b2c3d4"
+        assert signals[0].strength == 0.8
+        assert signals[0].data == {"k": 1}
+    
+    def test_emit_reinforces_legacy_signal(self, legacy_dir):
+        """The same triple reinforces the legacy signal instead of adding one."""
+        coordinator = make_coordinator(legacy_dir)
+        signal = coordinator.emit(SignalType.SUCCESS, "agent_a", "task1")
+        assert signal.id == "a1b2c3d4"
+        assert signal.reinforcement_count == 3
+    
+    def test_first_flush_upgrades_index(self, legacy_dir):
+        """The first flush writes a full index.json with a generation and log."""
+        coordinator = make_coordinator(legacy_dir)
+        coordinator.emit(SignalType.FAILURE, "agent_b", "task2")
+        coordinator.flush()
+        
+        index = json.loads((legacy_dir / "index.json").read_text())
+        assert "generation" in index
+        assert index["signals"]["a1b2c3d4"]["strength"] == 0.8
+        assert read_log(legacy_dir) == [{"op": "base", "generation": index["generation"]}]
+        
+        agents = sorted(s.source_agent for s in make_coordinator(legacy_dir).sense())
+        assert agents == ["agent_a", "agent_b"]
+
+
+class TestLockOrder:
+    """Test writers take the index lock and _lock in the same order."""
+    
+    def test_clear_during_flush(self, swarm_dir):
+        """clear() while another thread is inside flush() does not deadlock."""
+        coordinator = make_coordinator(swarm_dir)
+        coordinator.emit(SignalType.SUCCESS, "agent_a", "task1")
+        
+        # Hold flush() between taking the index lock and taking _lock
+        lock_index = coordinator._lock_index
+        in_flush = threading.Event()
+        
+        def slow_lock_index():
+            lock = lock_index()
+            if not in_flush.is_set():
+                in_flush.set()
+                time.sleep(0.2)
+            return lock
+        
+        coordinator._lock_index = slow_lock_index
+        flusher = threading.Thread(target=coordinator.flush, daemon=True)
+        flusher.start()
+        assert in_flush.wait(5)
+        clearer = threading.Thread(target=coordinator.clear, daemon=True)
+        clearer.start()
+        
+        flusher.join(5)
+        clearer.join(5)
+        assert not flusher.is_alive()
+        assert not clearer.is_alive()
+        assert coordinator.sense() == []
+        assert make_coordinator(swarm_dir).sense() == []